@@ -0,0 +1,209 @@
+import collections.abc
+import dataclasses
+import types
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Sequence,
+    Tuple,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+from config_loader.exceptions import ValidationError
+
+Converter = Callable[[Any, str], Any]
+
+_CONVERTERS: Dict[Any, Converter] = {}
+_MISSING = dataclasses.MISSING
+_TRUE_STRINGS = frozenset({"true", "yes", "on", "1"})
+_FALSE_STRINGS = frozenset({"false", "no", "off", "0"})
+# X | Y unions (Python 3.10+) have their own origin type
+_UNION_ORIGINS = (Union, getattr(types, "UnionType", Union))
+
+
+def bind(data: Any, target: Any) -> Any:
+    """Converts config data to the target type (usually a dataclass)."""
+    return converter_for(target)(data, "")
+
+
+def converter_for(target: Any) -> Converter:
+    """Returns the converter for a type, building and caching it on first use."""
+    converter = _CONVERTERS.get(target)
+    if converter is None:
+        converter = _build_converter(target)
+        _CONVERTERS[target] = converter
+    return converter
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def _fail(path: str, message: str) -> ValidationError:
+    return ValidationError(f"{path or '<root>'}: {message}")
+
+
+def _build_converter(target: Any) -> Converter:
+    if dataclasses.is_dataclass(target) and isinstance(target, type):
+        return _dataclass_converter(target)
+
+    origin = get_origin(target) or target
+    if origin in _UNION_ORIGINS:
+        return _union_converter(get_args(target))
+    if origin in (list, tuple, collections.abc.Sequence):
+        return _sequence_converter(origin, get_args(target))
+    if origin in (dict, collections.abc.Mapping):
+        return _mapping_converter(get_args(target))
+    if isinstance(target, type):
+        return _scalar_converter(target)
+    raise TypeError(f"Unsupported binding type: {target!r}")
+
+
+def _identity(value: Any, _path: str) -> Any:
+    return value
+
+
+def _bool_converter(value: Any, path: str) -> bool:
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, str) and value.lower() in _TRUE_STRINGS:
+        return True
+    if isinstance(value, str) and value.lower() in _FALSE_STRINGS:
+        return False
+    raise _fail(path, f"expected bool, got {value!r}")
+
+
+def _scalar_converter(target: type) -> Converter:
+    # Strings parse to numbers, ints widen to floats and numbers format to strings;
+    # other values must match
+    numeric = target in (int, float)
+    accepted: Tuple[type, ...] = (target, int, float) if target in (float, str) else (target,)
+
+    def convert(value: Any, path: str) -> Any:
+        if isinstance(value, bool) and target is not bool:
+            raise _fail(path, f"expected {target.__name__}, got {value!r}")
+        if isinstance(value, accepted):
+            return value if isinstance(value, target) else target(value)
+        if numeric and isinstance(value, str):
+            try:
+                return target(value)
+            except ValueError as e:
+                raise _fail(path, f"expected {target.__name__}, got {value!r}") from e
+        raise _fail(path, f"expected {target.__name__}, got {value!r}")
+
+    return convert
+
+
+def _union_converter(args: Tuple[Any, ...]) -> Converter:
+    optional = type(None) in args
+    converters = [converter_for(arg) for arg in args if arg is not type(None)]
+
+    def convert(value: Any, path: str) -> Any:
+        if value is None and optional:
+            return None
+        for converter in converters:
+            try:
+                return converter(value, path)
+            except ValidationError:
+                continue
+        raise _fail(path, f"no matching type for {value!r}")
+
+    return convert
+
+
+def _sequence_converter(origin: Any, args: Tuple[Any, ...]) -> Converter:
+    as_tuple = origin is tuple
+    if as_tuple and len(args) == 2 and args[1] is Ellipsis:
+        args = args[:1]
+    elif as_tuple and args:
+        return _fixed_tuple_converter(args)
+    item_converter = converter_for(args[0]) if len(args) == 1 else _identity
+
+    def convert(value: Any, path: str) -> Any:
+        _check_sequence(value, path)
+        items = [item_converter(item, _join(path, i)) for i, item in enumerate(value)]
+        return tuple(items) if as_tuple else items
+
+    return convert
+
+
+def _fixed_tuple_converter(args: Tuple[Any, ...]) -> Converter:
+    converters = [converter_for(arg) for arg in args]
+
+    def convert(value: Any, path: str) -> Tuple[Any, ...]:
+        _check_sequence(value, path)
+        if len(value) != len(converters):
+            raise _fail(path, f"expected {len(converters)} items, got {len(value)}")
+        return tuple(
+            converter(item, _join(path, i))
+            for i, (converter, item) in enumerate(zip(converters, value))
+        )
+
+    return convert
+
+
+def _check_sequence(value: Any, path: str) -> None:
+    if isinstance(value, (str, bytes, Mapping)) or not isinstance(value, Sequence):
+        raise _fail(path, f"expected a list, got {value!r}")
+
+
+def _mapping_converter(args: Tuple[Any, ...]) -> Converter:
+    key_converter = converter_for(args[0]) if args else _identity
+    value_converter = converter_for(args[1]) if args else _identity
+
+    def convert(value: Any, path: str) -> Dict[Any, Any]:
+        if not isinstance(value, Mapping):
+            raise _fail(path, f"expected a mapping, got {value!r}")
+        return {
+            key_converter(key, path): value_converter(item, _join(path, key))
+            for key, item in value.items()
+        }
+
+    return convert
+
+
+def _dataclass_converter(cls: type) -> Converter:
+    fields: List[Tuple[str, Converter, bool]] = []
+
+    def convert(value: Any, path: str) -> Any:
+        if isinstance(value, cls):
+            return value
+        if not isinstance(value, Mapping):
+            raise _fail(path, f"expected a mapping for {cls.__name__}, got {value!r}")
+        kwargs = {}
+        for name, converter, required in fields:
+            if name in value:
+                kwargs[name] = converter(value[name], _join(path, name))
+            elif required:
+                raise _fail(_join(path, name), "missing required field")
+        return cls(**kwargs)
+
+    # Registered before fields are resolved so self-referencing dataclasses terminate.
+    _CONVERTERS[cls] = convert
+    try:
+        fields.extend(_dataclass_fields(cls))
+    except Exception:
+        # A half-built converter must not be reused
+        del _CONVERTERS[cls]
+        raise
+    return convert
+
+
+def _dataclass_fields(cls: type) -> List[Tuple[str, Converter, bool]]:
+    hints = get_type_hints(cls)
+    fields = []
+    for field in dataclasses.fields(cls):
+        if not field.init:
+            continue
+        required = field.default is _MISSING and field.default_factory is _MISSING
+        fields.append((field.name, converter_for(hints.get(field.name, Any)), required))
+    return fields
+
+
+_CONVERTERS.update({Any: _identity, object: _identity, bool: _bool_converter})
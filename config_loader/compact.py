@@ -0,0 +1,196 @@
+import gc
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, List, Mapping, NamedTuple, Optional, Tuple
+
+from config_loader.frozen import FrozenArray, FrozenDict
+from config_loader.records import RecordTable
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None
+
+DEFAULT_MAX_INTERN_LENGTH = 64
+
+NUMERIC_ARRAY_TYPES: Tuple[type, ...] = (array, FrozenArray)
+if numpy is not None:  # pragma: no cover - optional dependency
+    NUMERIC_ARRAY_TYPES += (numpy.ndarray,)
+SEQUENCE_TYPES: Tuple[type, ...] = (list, tuple, RecordTable) + NUMERIC_ARRAY_TYPES
+_SLOTTED_TYPES = (FrozenDict, FrozenArray)
+
+
+class CompactionReport(NamedTuple):
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+
+def deep_sizeof(data: Any) -> int:
+    """Returns the size in bytes of a config tree, counting shared objects once."""
+    seen = set()
+    total = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        total += sys.getsizeof(node)
+        if isinstance(node, Mapping):
+            stack.extend(node.keys())
+            stack.extend(node.values())
+        elif isinstance(node, (list, tuple, set, frozenset)):
+            stack.extend(node)
+        elif isinstance(node, RecordTable):
+            stack.extend((node.keys, node.rows, node.positions))
+        if isinstance(node, _SLOTTED_TYPES):
+            # getsizeof() only counts the slot pointers, not the storage behind them
+            stack.extend(getattr(node, name) for name in type(node).__slots__)
+        elif isinstance(node, MappingProxyType):
+            stack.extend(gc.get_referents(node))
+    return total
+
+
+class Compactor:
+    """Interns keys and short strings and hash-conses identical immutable subtrees.
+
+    Only immutable nodes (FrozenDict, tuple, frozenset) are deduplicated, so mutable
+    trees keep one object per occurrence and only get their strings interned. Nodes
+    shared in the input (YAML aliases) stay shared.
+    """
+
+    def __init__(self, max_intern_length: int = DEFAULT_MAX_INTERN_LENGTH) -> None:
+        self.max_intern_length = max_intern_length
+        self._shared: Dict[Hashable, Any] = {}
+        self._memo: Dict[int, Any] = {}
+
+    def compact(self, data: Any) -> Any:
+        if isinstance(data, str):
+            return sys.intern(data) if len(data) <= self.max_intern_length else data
+        if not isinstance(data, (Mapping, list, tuple, set, frozenset)):
+            return data
+        result = self._memo.get(id(data))
+        if result is None:
+            result = self._compact_container(data)
+            self._memo[id(data)] = result
+            self._memo[id(result)] = result
+        return result
+
+    def _compact_container(self, data: Any) -> Any:
+        if isinstance(data, Mapping):
+            items = [(self._key(key), self.compact(value)) for key, value in data.items()]
+            if isinstance(data, FrozenDict):
+                key = tuple((self._identity(k), self._identity(v)) for k, v in items)
+                return self._share(("map", key), items)
+            return dict(items)
+        values = [self.compact(item) for item in data]
+        if isinstance(data, list):
+            return values
+        kind = "tuple" if isinstance(data, tuple) else "set"
+        return self._share((kind, tuple(self._identity(v) for v in values)), values, kind)
+
+    def _share(self, key: Hashable, values: List[Any], kind: str = "map") -> Any:
+        shared = self._shared.get(key)
+        if shared is None:
+            if kind == "map":
+                shared = FrozenDict(dict(values))
+            elif kind == "tuple":
+                shared = tuple(values)
+            else:
+                shared = frozenset(values)
+            self._shared[key] = shared
+        return shared
+
+    def _key(self, key: Any) -> Any:
+        return sys.intern(key) if isinstance(key, str) else key
+
+    @staticmethod
+    def _identity(value: Any) -> Hashable:
+        """Structural key of an already compacted value; containers are canonical by id."""
+        if isinstance(value, float):
+            return (float, value.hex())
+        if value is None or isinstance(value, (str, int, bool, bytes)):
+            return (type(value), value)
+        return ("id", id(value))
+
+
+def compact_tree(
+    data: Any, max_intern_length: int = DEFAULT_MAX_INTERN_LENGTH
+) -> Tuple[Any, CompactionReport]:
+    """Compacts a config tree and reports its size before and after."""
+    bytes_before = deep_sizeof(data)
+    result = Compactor(max_intern_length).compact(data)
+    return result, CompactionReport(bytes_before, deep_sizeof(result))
+
+
+def pack_numeric_arrays(data: Any, threshold: int, use_numpy: bool = False) -> Any:
+    """Stores homogeneous int or float lists of at least threshold items as compact arrays.
+
+    Uses NumPy arrays when use_numpy is set and NumPy is installed, array.array otherwise.
+    Unchanged subtrees are returned as is.
+    """
+    if isinstance(data, Mapping):
+        packed = {
+            key: pack_numeric_arrays(value, threshold, use_numpy) for key, value in data.items()
+        }
+        if all(packed[key] is value for key, value in data.items()):
+            return data
+        return FrozenDict(packed) if isinstance(data, FrozenDict) else packed
+    if isinstance(data, (list, tuple)):
+        if len(data) >= threshold:
+            packed_array = _numeric_array(data, use_numpy)
+            if packed_array is not None:
+                return packed_array
+        items = [pack_numeric_arrays(item, threshold, use_numpy) for item in data]
+        if all(new is old for new, old in zip(items, data)):
+            return data
+        return tuple(items) if isinstance(data, tuple) else items
+    return data
+
+
+def _numeric_array(data: Any, use_numpy: bool) -> Optional[Any]:
+    item_types = set(map(type, data))
+    if item_types == {int}:
+        typecode = "q"
+    elif item_types == {float}:
+        typecode = "d"
+    else:
+        return None
+    try:
+        if use_numpy and numpy is not None:
+            return numpy.array(data, dtype=numpy.int64 if typecode == "q" else numpy.float64)
+        return array(typecode, data)
+    except OverflowError:
+        return None
+
+
+def pack_record_tables(data: Any, threshold: int) -> Any:
+    """Stores lists of at least threshold mappings with identical keys as RecordTables.
+
+    Unchanged subtrees are returned as is.
+    """
+    if isinstance(data, Mapping):
+        packed = {key: pack_record_tables(value, threshold) for key, value in data.items()}
+        if all(packed[key] is value for key, value in data.items()):
+            return data
+        return FrozenDict(packed) if isinstance(data, FrozenDict) else packed
+    if isinstance(data, (list, tuple)):
+        items = [pack_record_tables(item, threshold) for item in data]
+        if len(items) >= threshold and _same_shape(items):
+            return RecordTable.from_records(items)
+        if all(new is old for new, old in zip(items, data)):
+            return data
+        return tuple(items) if isinstance(data, tuple) else items
+    return data
+
+
+def _same_shape(items: List[Any]) -> bool:
+    if not items or not isinstance(items[0], Mapping):
+        return False
+    keys = tuple(items[0])
+    return all(isinstance(item, Mapping) and tuple(item) == keys for item in items)
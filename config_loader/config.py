@@ -1,12 +1,102 @@
+from array import array
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
 
-from config_loader.utils import yaml_load_config, yaml_load_configs
+from config_loader.binding import bind
+from config_loader.compact import (
+    SEQUENCE_TYPES,
+    CompactionReport,
+    compact_tree,
+    pack_numeric_arrays,
+    pack_record_tables,
+)
+from config_loader.diff import ConfigChange, TreeDiffer
+from config_loader.env import Env, EnvFactory, EnvSource
+from config_loader.exceptions import ConfigError, ValidationError
+from config_loader.fingerprint import Fingerprinter
+from config_loader.frozen import FrozenArray, FrozenDict, freeze
+from config_loader.layers import LayerStack
+from config_loader.merge import DeepMerger
+from config_loader.objects import to_object
+from config_loader.overrides import EnvOverrides
+from config_loader.paths import Selector, parse_path
+from config_loader.persistent import PathCopier
+from config_loader.records import RecordTable
+from config_loader.references import ReferenceResolver, resolve_references
+from config_loader.subscriptions import ChangeCallback, Subscription, SubscriptionTrie
+from config_loader.templates import TemplateIndex
+from config_loader.utils import yaml_load_config, yaml_load_configs, yaml_load_merged_configs
+from config_loader.yaml_service import YamlLoaderFactory, YamlReaderService
+
+T = TypeVar("T")
+_MISSING = object()
+_INDEXABLE_TYPES = (list, tuple, array, FrozenArray, RecordTable)
+
+
+def _index(key: str, length: int) -> Optional[int]:
+    try:
+        idx = int(key)
+    except (ValueError, TypeError):
+        return None
+    return idx if 0 <= idx < length else None
+
+
+def _ndarray_item(node: Any, key: str) -> Any:
+    # NumPy arrays return Python scalars through item()
+    idx = _index(key, len(node))
+    return _MISSING if idx is None else node.item(idx)
+
+
+def _child(node: Any, key: str) -> Any:
+    if isinstance(node, _INDEXABLE_TYPES):
+        idx = _index(key, len(node))
+        return _MISSING if idx is None else node[idx]
+    if isinstance(node, SEQUENCE_TYPES):
+        return _ndarray_item(node, key)
+    if isinstance(node, Mapping):
+        return node.get(key, _MISSING)
+    return _MISSING
+
+
+def _field_matches(record: Any, selector: Selector) -> bool:
+    return (
+        isinstance(record, Mapping)
+        and selector.field in record
+        and str(record[selector.field]) == selector.value
+    )
 
 
 class ConfigCollection:
-    def __init__(self, configs: Dict[str, Any]) -> None:
+    configs: Dict[str, Any]
+
+    def __init__(
+        self, configs: Dict[str, Any], loader: Optional[Callable[[], Dict[str, Any]]] = None
+    ) -> None:
         self.configs = configs
+        self.loader = loader
+        self.compaction: Optional[CompactionReport] = None
+        self._indexes: Dict[Tuple[str, str], Tuple[Any, Dict[str, Any]]] = {}
+        self._fingerprints = Fingerprinter()
+        self._subscriptions = SubscriptionTrie()
+        self.templates: Optional[TemplateIndex] = None
+
+    @property
+    def frozen(self) -> bool:
+        return isinstance(self.configs, FrozenDict)
 
     def all(self) -> Dict[str, Any]:
         return self.configs
@@ -15,45 +105,515 @@ class ConfigCollection:
         """Get a value from nested dictionary using dot notation.
 
         Args:
-            key: Key in dot notation (e.g. 'parent.child.key' or 'array.0.name')
+            key: Key in dot notation (e.g. 'parent.child.key', 'array.0.name' or
+                'array[name=first].id' to select a record by field value)
             default: Default value to return if key not found
 
         Returns:
             Value from dictionary or default if not found
         """
-        keys = key.split(".")
-        current: Any = self.all()
+        return self._lookup(self.all(), key, default)
 
-        for k in keys:
-            if not isinstance(current, (dict, list)):
-                return default
+    def _lookup(self, root: Any, key: str, default: Any) -> Any:
+        steps = parse_path(key) if "[" in key else key.split(".")
+        current: Any = root
 
-            if isinstance(current, list):
-                try:
-                    idx = int(k)
-                    if 0 <= idx < len(current):
-                        current = current[idx]
-                    else:
-                        return default
-                except (ValueError, TypeError):
-                    return default
+        for step in steps:
+            if isinstance(step, Selector):
+                current = self._select(step, current)
             else:
-                if k not in current:
-                    return default
-                current = current[k]
+                current = _child(current, step)
+            if current is _MISSING:
+                return default
 
         return current
 
+    def _select(self, selector: Selector, records: Any) -> Any:
+        """Finds a record by field value.
+
+        Immutable lists (frozen tuples, record tables) get a lazily built index per
+        (list path, field); plain lists can change in place, so they are scanned.
+        """
+        if isinstance(records, list):
+            return next(
+                (record for record in records if _field_matches(record, selector)), _MISSING
+            )
+        if not isinstance(records, (tuple, RecordTable)):
+            return _MISSING
+        cached = self._indexes.get((selector.list_path, selector.field))
+        if cached is None or cached[0] is not records:
+            index: Dict[str, Any] = {}
+            for record in records:
+                if isinstance(record, Mapping) and selector.field in record:
+                    index.setdefault(str(record[selector.field]), record)
+            cached = (records, index)
+            self._indexes[(selector.list_path, selector.field)] = cached
+        return cached[1].get(selector.value, _MISSING)
+
+    def as_object(self) -> Any:
+        """Returns the configs as a tree of read-only attribute objects (cfg.database.host)."""
+        return to_object(self.all())
+
+    def bind(self, key: str, cls: Type[T]) -> T:
+        """Binds the section at key to a dataclass (nested dataclasses, Optional, List, Dict).
+
+        Raises:
+            ValidationError: If the section is missing or does not match the dataclass
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise ValidationError(f"Config section '{key}' not found")
+        return cast(T, bind(value, cls))
+
+    def fingerprint(self, key: str = "") -> str:
+        """Returns a content hash of the value at key, or of all configs if key is empty.
+
+        Parents are hashed from their children. In frozen trees hashes are memoized per
+        subtree, so subtrees shared with the previous version (after set(),
+        with_updates() or a reload keeping them) are not rehashed; mutable trees can be
+        changed in place and are rehashed on every call.
+
+        Raises:
+            ConfigError: If the key is not found
+        """
+        value = self.get(key, _MISSING) if key else self.all()
+        if value is _MISSING:
+            raise ConfigError(f"Config key '{key}' not found")
+        fingerprint = self.fingerprinter.fingerprint(value)
+        if not key:
+            self.fingerprinter.forget_previous()
+        return fingerprint
+
+    @property
+    def fingerprinter(self) -> Fingerprinter:
+        """Memoized subtree hashes of the current configs."""
+        return self._fingerprints
+
+    def content_equals(self, other: "ConfigCollection") -> bool:
+        """Compares the content of two collections through their fingerprints."""
+        return self.fingerprint() == other.fingerprint()
+
+    def diff(self, other: "ConfigCollection") -> List[ConfigChange]:
+        """Returns the path-level changes turning these configs into the other ones.
+
+        Identical subtrees are skipped by identity or memoized fingerprint, so once both
+        collections are fingerprinted the cost follows the number of changes.
+        """
+        differ = TreeDiffer(self.fingerprinter, other.fingerprinter)
+        return differ.diff(self.all(), other.all())
+
+    def set(self, key: str, value: Any) -> "ConfigCollection":
+        """Returns a new collection with the value at key replaced.
+
+        Only the containers on the path are copied; everything else is shared with this
+        collection, which is left unchanged.
+
+        Raises:
+            ConfigError: If the path goes through a scalar or a missing list item
+        """
+        return self.with_updates({key: value})
+
+    def with_updates(self, updates: Mapping[str, Any]) -> "ConfigCollection":
+        """Returns a new collection with the values at the given dot-notation keys replaced.
+
+        Raises:
+            ConfigError: If a path goes through a scalar or a missing list item
+        """
+        copier = PathCopier()
+        configs = self.all()
+        for key, value in updates.items():
+            configs = copier.set(configs, key, value)
+        collection = ConfigCollection(configs, self.loader)
+        collection._fingerprints = Fingerprinter(  # pylint: disable=protected-access
+            self.fingerprinter
+        )
+        return collection
+
+    def apply_env(self, env: Env, variables: Optional[Iterable[str]] = None) -> List[ConfigChange]:
+        """Re-renders the templated values with a new environment, like a reload.
+
+        Only the values indexed when the collection was loaded are rendered, see
+        ConfigFactory.create_templated(); with variables (e.g. the names returned by
+        Env.update()) only the values using them. Returns the changes.
+
+        Raises:
+            ConfigError: If the collection was not loaded with templates
+        """
+        if self.templates is None:
+            raise ConfigError("Config collection has no templates to render")
+        previous = self.all()
+        self._replace(self.templates.render(previous, env, variables=variables))
+        return TreeDiffer().diff(previous, self.all())
+
+    def subscribe(self, pattern: str, callback: ChangeCallback) -> Subscription:
+        """Registers a callback for reloads changing paths matching pattern.
+
+        Patterns use dot notation, '*' matching any single key (e.g. 'database.*'). The
+        callback receives the list of matching changes; callbacks run in subscription
+        order and their errors are logged without affecting the others.
+        """
+        return self._subscriptions.add(pattern, callback)
+
+    def section(self, prefix: str) -> "ConfigSection":
+        """Returns a view of the subtree at prefix that shares storage with this collection."""
+        return ConfigSection(self, prefix)
+
+    def reload(self, configs: Optional[Dict[str, Any]] = None) -> None:
+        """Replaces the configs, re-reading them through the loader if none are given.
+
+        Given configs are not indexed for apply_env(), so templates are dropped.
+
+        Raises:
+            ConfigError: If no configs are given and the collection has no loader
+        """
+        if configs is None:
+            if self.loader is None:
+                raise ConfigError("Config collection has no loader to reload from")
+            configs = self.loader()
+        else:
+            self.templates = None
+        self._replace(configs)
+
+    def _replace(self, configs: Dict[str, Any]) -> None:
+        previous = self.all() if self._subscriptions else None
+        previous_hashes = self.fingerprinter
+        self.configs = configs
+        self._indexes.clear()
+        self._fingerprints = Fingerprinter(previous_hashes)
+        if previous is not None:
+            differ = TreeDiffer(previous_hashes, self.fingerprinter)
+            self._subscriptions.notify(differ.diff(previous, self.all()))
+
+
+class ConfigSection(ConfigCollection):
+    """View of a subtree of a root collection.
+
+    Paths are resolved relative to the prefix through the root on every access, so
+    the view holds no data of its own and follows the root across reloads. State and
+    operations of the collection (templates, compaction, updates, apply_env) are the
+    root's.
+    """
+
+    def __init__(  # pylint: disable=super-init-not-called
+        self, root: ConfigCollection, prefix: str
+    ) -> None:
+        if isinstance(root, ConfigSection):
+            prefix = root.path(prefix)
+            root = root.root
+        self.root: ConfigCollection = root
+        self.prefix = prefix
+
+    @property  # type: ignore[override]
+    def configs(self) -> Dict[str, Any]:
+        if not self.prefix:
+            return self.root.all()
+        return cast(Dict[str, Any], self.root.get(self.prefix, {}))
+
+    @property
+    def loader(self) -> Optional[Callable[[], Dict[str, Any]]]:  # type: ignore[override]
+        return self.root.loader
+
+    @property
+    def compaction(self) -> Optional[CompactionReport]:  # type: ignore[override]
+        return self.root.compaction
+
+    @property
+    def templates(self) -> Optional[TemplateIndex]:  # type: ignore[override]
+        return self.root.templates
+
+    @property
+    def frozen(self) -> bool:
+        return self.root.frozen
+
+    def path(self, key: str) -> str:
+        """Returns the root path of a key relative to this section."""
+        return f"{self.prefix}.{key}" if self.prefix else key
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.root.get(self.path(key), default)
+
+    def section(self, prefix: str) -> "ConfigSection":
+        return ConfigSection(self.root, self.path(prefix))
+
+    def fingerprint(self, key: str = "") -> str:
+        return self.root.fingerprint(self.path(key) if key else self.prefix)
+
+    @property
+    def fingerprinter(self) -> Fingerprinter:
+        return self.root.fingerprinter
+
+    def subscribe(self, pattern: str, callback: ChangeCallback) -> Subscription:
+        return self.root.subscribe(self.path(pattern) if pattern else self.prefix, callback)
+
+    def with_updates(self, updates: Mapping[str, Any]) -> "ConfigCollection":
+        """Returns the same section of a new root collection with the updates applied."""
+        root = self.root.with_updates({self.path(key): value for key, value in updates.items()})
+        return ConfigSection(root, self.prefix)
+
+    def apply_env(self, env: Env, variables: Optional[Iterable[str]] = None) -> List[ConfigChange]:
+        """Re-renders the root collection; returns all its changes, with root paths."""
+        return self.root.apply_env(env, variables)
+
+    def reload(self, configs: Optional[Dict[str, Any]] = None) -> None:
+        """Reloads the root collection; configs, if given, replace the whole root tree."""
+        self.root.reload(configs)
+
+
+class LayeredConfigCollection(ConfigCollection):
+    """Collection over a stack of layers (e.g. defaults, environment, host, overrides).
+
+    Layers are kept separate and resolved path by path with memoization, see LayerStack.
+    Assigning configs or reloading with configs replaces the top layer.
+    """
+
+    def __init__(
+        self,
+        layers: Sequence[Mapping[str, Any]],
+        loader: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> None:
+        self.stack = LayerStack(layers)
+        super().__init__(cast(Dict[str, Any], self.stack.layers[-1]), loader)
+
+    @property
+    def configs(self) -> Dict[str, Any]:
+        return self.stack.all()
+
+    @configs.setter
+    def configs(self, configs: Dict[str, Any]) -> None:
+        self.set_layer(-1, configs)
+
+    @property
+    def layers(self) -> List[Mapping[str, Any]]:
+        return self.stack.layers
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if "[" in key:
+            return super().get(key, default)
+        return self.stack.get(key, default)
+
+    def set_layer(self, index: int, configs: Mapping[str, Any]) -> None:
+        """Replaces one layer; only memoized paths defined by the old or new layer are dropped."""
+        self.stack.set_layer(index, configs)
+        if hasattr(self, "_indexes"):  # Not yet set while ConfigCollection.__init__ runs
+            self._indexes.clear()
+            self._fingerprints = Fingerprinter(self._fingerprints)
+
+
+class LazyConfigCollection(ConfigCollection):
+    """Collection keeping raw strings and resolving ${VAR} placeholders on access.
+
+    Values returned by get() are resolved once and memoized until the configs are
+    replaced or the env version changes (see Env.refresh()); all() resolves the whole
+    tree on demand. Record selectors match the raw field values.
+    """
+
+    def __init__(
+        self,
+        configs: Dict[str, Any],
+        env: Env,
+        loader: Optional[Callable[[], Dict[str, Any]]] = None,
+    ) -> None:
+        self.env = env
+        self._resolved: Dict[str, Any] = {}
+        self._env_version = env.version
+        super().__init__(configs, loader)
+
+    @property
+    def configs(self) -> Dict[str, Any]:
+        """The raw, unresolved configs."""
+        return self._raw
+
+    @configs.setter
+    def configs(self, configs: Dict[str, Any]) -> None:
+        self._raw = configs
+        self._resolved.clear()
+
+    def all(self) -> Dict[str, Any]:
+        return cast(Dict[str, Any], self._memoized("", lambda: self._raw))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = (
+            self._memoized(key, lambda: self._lookup(self._raw, key, _MISSING)) if key else _MISSING
+        )
+        return default if value is _MISSING else value
+
+    def _memoized(self, key: str, lookup: Callable[[], Any]) -> Any:
+        if self._env_version != self.env.version:
+            self._resolved.clear()
+            self._env_version = self.env.version
+        value = self._resolved.get(key, _MISSING)
+        if value is _MISSING:
+            value = lookup()
+            if value is not _MISSING:
+                value = self.env.replace_vars(value)
+            self._resolved[key] = value
+        return value
+
+
+def _load_env(env_path: EnvSource) -> Env:
+    """Returns the Env to load with: a given Env refreshed, or a new one for the .env paths."""
+    if isinstance(env_path, Env):
+        env_path.refresh()
+        return env_path
+    return EnvFactory.create(env_path)
+
+
+class StorageOptions(NamedTuple):
+    """How a config tree is stored.
+
+    Attributes:
+        frozen: Build an immutable, hashable tree that can be shared without copies
+        compact: Intern keys and short strings and, for frozen trees, share identical
+            subtrees; the bytes saved are reported in ConfigCollection.compaction
+        numeric_array_threshold: Store homogeneous int/float lists with at least this
+            many items as compact arrays
+        use_numpy: Use NumPy arrays for such lists when NumPy is installed
+        record_table_threshold: Store lists with at least this many records sharing
+            the same keys column-wise as RecordTables
+    """
+
+    frozen: bool = False
+    compact: bool = False
+    numeric_array_threshold: Optional[int] = None
+    use_numpy: bool = False
+    record_table_threshold: Optional[int] = None
+
 
 class ConfigFactory:
     @staticmethod
-    def create(configs: Dict[str, Any]) -> ConfigCollection:
-        return ConfigCollection(configs)
+    def create(
+        configs: Dict[str, Any],
+        storage: Optional[StorageOptions] = None,
+        references: bool = False,
+    ) -> ConfigCollection:
+        """Creates a collection stored as described by storage.
+
+        With references, ${config:path} references between values are resolved, see
+        ReferenceResolver; otherwise such strings are kept as they are.
+        """
+        if references:
+            configs = resolve_references(configs)
+        configs, report = ConfigFactory._prepare(configs, storage)
+        collection = ConfigCollection(configs)
+        collection.compaction = report
+        return collection
 
     @staticmethod
     def create_by_path(
-        yaml_config_path: Path, env_path: Union[Path, str, None] = None
+        yaml_config_path: Path,
+        env_path: EnvSource = None,
+        storage: Optional[StorageOptions] = None,
+        merger: Optional[DeepMerger] = None,
+        overrides: Optional[EnvOverrides] = None,
+    ) -> ConfigCollection:
+        """Loads a YAML file or directory; see create() for storage.
+
+        Configs of a directory are keyed by file name, or folded into one tree by merger.
+        Environment variables are substituted while parsing; on reload only references
+        affected by the changes are re-evaluated. Prefixed variables mapped by overrides
+        are deep-merged over the loaded configs.
+
+        The .env files are loaded into os.environ, see Env. To keep the process
+        environment untouched or read a secrets directory, pass an Env (e.g.
+        Env('.env', isolated=True)) as env_path; it is refreshed on every load.
+        """
+        references = ReferenceResolver()
+
+        def load() -> Tuple[Dict[str, Any], Optional[CompactionReport]]:
+            configs: Dict[str, Any]
+            env = _load_env(env_path)
+            if yaml_config_path.is_file():
+                configs = yaml_load_config(yaml_config_path, env, fused=True)
+            elif merger is not None:
+                configs = yaml_load_merged_configs(yaml_config_path, env, merger, fused=True)
+            else:
+                configs = yaml_load_configs(yaml_config_path, env, fused=True)
+            if overrides is not None:
+                configs = overrides.apply(configs, env.view())
+            return ConfigFactory._prepare(references.resolve(configs), storage)
+
+        def loader() -> Dict[str, Any]:
+            configs, collection.compaction = load()
+            return configs
+
+        configs, report = load()
+        collection = ConfigCollection(configs, loader)
+        collection.compaction = report
+        return collection
+
+    @staticmethod
+    def create_templated(
+        yaml_config_path: Path,
+        env_path: EnvSource = None,
+        merger: Optional[DeepMerger] = None,
     ) -> ConfigCollection:
+        """Loads a YAML file or directory, compiling its templated strings once.
+
+        The collection keeps the template locations, so ConfigCollection.apply_env()
+        re-renders only those values; reloading re-reads the files and the index. See
+        create_by_path() for env_path. ${config:path} references are not resolved.
+        """
+
+        def load() -> Tuple[Dict[str, Any], TemplateIndex]:
+            raw = ConfigFactory._load_raw(yaml_config_path, merger)
+            templates = TemplateIndex.scan(raw)
+            return templates.render(raw, _load_env(env_path)), templates
+
+        def loader() -> Dict[str, Any]:
+            configs, collection.templates = load()
+            return configs
+
+        configs, templates = load()
+        collection = ConfigCollection(configs, loader)
+        collection.templates = templates
+        return collection
+
+    @staticmethod
+    def create_lazy(
+        yaml_config_path: Path,
+        env_path: EnvSource = None,
+        merger: Optional[DeepMerger] = None,
+    ) -> LazyConfigCollection:
+        """Loads a YAML file or directory whose placeholders are resolved on first access.
+
+        See create_by_path() for env_path; values are resolved again after Env.refresh(),
+        which reload() calls. ${config:path} references are not resolved.
+        """
+        env = EnvFactory.from_source(env_path)
+
+        def loader() -> Dict[str, Any]:
+            _load_env(env)
+            return ConfigFactory._load_raw(yaml_config_path, merger)
+
+        return LazyConfigCollection(ConfigFactory._load_raw(yaml_config_path, merger), env, loader)
+
+    @staticmethod
+    def create_layered(layers: Sequence[Mapping[str, Any]]) -> LayeredConfigCollection:
+        """Creates a collection resolving lookups through layers, lowest priority first."""
+        return LayeredConfigCollection(layers)
+
+    @staticmethod
+    def _load_raw(yaml_config_path: Path, merger: Optional[DeepMerger]) -> Dict[str, Any]:
+        """Loads a YAML file or directory without substituting environment variables."""
         if yaml_config_path.is_file():
-            return ConfigCollection(yaml_load_config(yaml_config_path, env_path))
-        return ConfigCollection(yaml_load_configs(yaml_config_path, env_path))
+            return YamlReaderService.load(yaml_config_path)
+        if merger is not None:
+            return YamlLoaderFactory.create().load_merged(yaml_config_path, merger)
+        return YamlLoaderFactory.create().load_configs(yaml_config_path)
+
+    @staticmethod
+    def _prepare(
+        configs: Dict[str, Any], storage: Optional[StorageOptions]
+    ) -> Tuple[Dict[str, Any], Optional[CompactionReport]]:
+        storage = storage or StorageOptions()
+        if storage.numeric_array_threshold is not None:
+            configs = pack_numeric_arrays(
+                configs, storage.numeric_array_threshold, storage.use_numpy
+            )
+        if storage.record_table_threshold is not None:
+            configs = pack_record_tables(configs, storage.record_table_threshold)
+        if storage.frozen:
+            configs = freeze(configs)
+        if storage.compact:
+            return compact_tree(configs)
+        return configs, None
@@ -0,0 +1,95 @@
+from enum import Enum
+from typing import Any, List, Mapping, NamedTuple, Optional
+
+from config_loader.compact import SEQUENCE_TYPES
+from config_loader.fingerprint import IMMUTABLE_TYPES, Fingerprinter
+
+
+class ChangeKind(Enum):
+    ADDED = "added"
+    REMOVED = "removed"
+    CHANGED = "changed"
+
+
+class ConfigChange(NamedTuple):
+    """Change of the value at a dot-notation path; old or new is None when absent."""
+
+    path: str
+    kind: ChangeKind
+    old: Any = None
+    new: Any = None
+
+
+class TreeDiffer:
+    """Computes the path-level changes between two config trees.
+
+    Identical subtrees are skipped by identity or, for frozen subtrees when fingerprinters
+    are given, by content hash, so with warm fingerprints of frozen trees the cost
+    follows the changed paths rather than the tree size. Mutable subtrees are compared
+    item by item.
+    """
+
+    def __init__(
+        self,
+        old_hashes: Optional[Fingerprinter] = None,
+        new_hashes: Optional[Fingerprinter] = None,
+    ) -> None:
+        self.old_hashes = old_hashes
+        self.new_hashes = new_hashes
+
+    def diff(self, old: Any, new: Any, path: str = "") -> List[ConfigChange]:
+        changes: List[ConfigChange] = []
+        self._diff(old, new, path, changes)
+        return changes
+
+    def _diff(self, old: Any, new: Any, path: str, changes: List[ConfigChange]) -> None:
+        if old is new:
+            return
+        if isinstance(old, Mapping) and isinstance(new, Mapping):
+            if not self._same_content(old, new):
+                self._diff_mappings(old, new, path, changes)
+        elif isinstance(old, SEQUENCE_TYPES) and isinstance(new, SEQUENCE_TYPES):
+            if not self._same_content(old, new):
+                self._diff_sequences(old, new, path, changes)
+        elif type(old) is not type(new) or old != new:
+            changes.append(ConfigChange(path, ChangeKind.CHANGED, old, new))
+
+    def _same_content(self, old: Any, new: Any) -> bool:
+        # Digests of mutable containers are not memoized, comparing them would rehash
+        # the subtrees at every level
+        if self.old_hashes is None or self.new_hashes is None:
+            return False
+        if not (isinstance(old, IMMUTABLE_TYPES) and isinstance(new, IMMUTABLE_TYPES)):
+            return False
+        return self.old_hashes.digest(old) == self.new_hashes.digest(new)
+
+    def _diff_mappings(
+        self, old: Mapping[str, Any], new: Mapping[str, Any], path: str, changes: List[ConfigChange]
+    ) -> None:
+        for key, value in old.items():
+            if key not in new:
+                changes.append(ConfigChange(_join(path, key), ChangeKind.REMOVED, old=value))
+            else:
+                self._diff(value, new[key], _join(path, key), changes)
+        for key, value in new.items():
+            if key not in old:
+                changes.append(ConfigChange(_join(path, key), ChangeKind.ADDED, new=value))
+
+    def _diff_sequences(self, old: Any, new: Any, path: str, changes: List[ConfigChange]) -> None:
+        for index in range(max(len(old), len(new))):
+            item_path = _join(path, index)
+            if index >= len(new):
+                changes.append(ConfigChange(item_path, ChangeKind.REMOVED, old=old[index]))
+            elif index >= len(old):
+                changes.append(ConfigChange(item_path, ChangeKind.ADDED, new=new[index]))
+            else:
+                self._diff(old[index], new[index], item_path, changes)
+
+
+def _join(path: str, key: Any) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def diff_trees(old: Any, new: Any) -> List[ConfigChange]:
+    """Returns the changes turning old into new, pruning identical subtrees by identity."""
+    return TreeDiffer().diff(old, new)
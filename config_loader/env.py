@@ -1,27 +1,160 @@
+import os
 import re
 from os import environ
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values, load_dotenv
+
+from config_loader.secret_files import SecretsDirectory, read_secret
+
+EnvPaths = Union[Path, str, Sequence[Union[Path, str]], None]
+
+# Parsed .env files: absolute path -> ((mtime, size), values)
+_DOTENV_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def read_dotenv(env_path: Union[Path, str]) -> Dict[str, str]:
+    """Parses a .env file without modifying os.environ.
+
+    Results are cached per path and modification time, so unchanged files are not
+    re-read. A missing file yields no values. The returned dict must not be modified.
+    """
+    path = os.path.abspath(env_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return {}
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _DOTENV_CACHE.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    values = {key: value for key, value in dotenv_values(path).items() if value is not None}
+    _DOTENV_CACHE[path] = (version, values)
+    return values
+
+
+def _as_paths(env_path: EnvPaths) -> List[Union[Path, str]]:
+    if env_path is None:
+        return []
+    if isinstance(env_path, (str, Path)):
+        return [env_path]
+    return list(env_path)
 
 
 class Env:
-    ENV_VAR_PATTERN = re.compile(r"\$\{(\w+)(?::([^}]+))?\}")  # Regexp: ${VAR_NAME:default}
+    """Snapshot of the environment variables, optionally extended by .env files.
+
+    By default .env files are loaded into os.environ. In isolated mode they are parsed
+    (see read_dotenv) into a private mapping layered over os.environ, leaving the process
+    environment untouched. Either way variables already set in the process take
+    precedence over .env files unless override is set, and later files take precedence
+    over earlier ones.
+
+    Lookups read a plain dict taken at creation; refresh() takes a new snapshot and
+    bumps version when the variables changed.
+
+    With a secrets directory (see SecretsDirectory), variables missing from the snapshot
+    are looked up in the file named by VAR_FILE for VAR, then in the directory. Files are
+    read on first access and re-read after refresh() detects an update.
+    """
+
+    # Regexp: ${VAR_NAME:default}; ${config:path} is a config reference, see references.py
+    ENV_VAR_PATTERN = re.compile(r"\$\{(?!config:)(\w+)(?::([^}]+))?\}")
+
+    def __init__(
+        self,
+        env_path: EnvPaths = None,
+        isolated: bool = False,
+        override: bool = False,
+        secrets_dir: Union[Path, str, None] = None,
+    ) -> None:
+        self.secrets = SecretsDirectory(secrets_dir) if secrets_dir is not None else None
+        self._secret_files: Dict[str, Optional[str]] = {}
+        self.env_paths = _as_paths(env_path)
+        self.isolated = isolated
+        self.override = override
+        self.version = 0
+        if not isolated:
+            # Without override the first loaded value wins, with it the last one does
+            for path in self.env_paths if override else reversed(self.env_paths):
+                load_dotenv(dotenv_path=path, override=override)
+            if env_path is None:
+                load_dotenv(override=override)
+        self.env_configs = self._snapshot()
 
-    def __init__(self, env_path: Union[Path, str, None] = None) -> None:
-        load_dotenv(dotenv_path=env_path)
-        self.env_configs = environ
+    def refresh(self) -> bool:
+        """Takes a new snapshot; returns whether the variables changed (and version was bumped).
+
+        In isolated mode .env files are re-read if they were modified. Cached VAR_FILE
+        files are dropped; the secrets directory is re-checked with one readlink.
+        """
+        self._secret_files.clear()
+        secrets_changed = self.secrets is not None and self.secrets.check()
+        configs = self._snapshot()
+        if configs == self.env_configs and not secrets_changed:
+            return False
+        self.env_configs = configs
+        self.version += 1
+        return True
+
+    def update(self, values: Mapping[str, Optional[str]]) -> Set[str]:
+        """Sets (or, for None, removes) variables in the snapshot without touching os.environ.
+
+        Returns the names of the variables that changed; version is bumped if any did.
+        The next refresh() replaces the snapshot, dropping these updates.
+        """
+        changed = {name for name, value in values.items() if self.env_configs.get(name) != value}
+        if changed:
+            configs = dict(self.env_configs)
+            for name in changed:
+                value = values[name]
+                if value is None:
+                    del configs[name]
+                else:
+                    configs[name] = value
+            self.env_configs = configs
+            self.version += 1
+        return changed
+
+    def _snapshot(self) -> Dict[str, str]:
+        if not self.isolated:
+            return dict(environ)
+        configs: Dict[str, str] = {}
+        for path in self.env_paths:
+            configs.update(read_dotenv(path))
+        if self.override:
+            return {**environ, **configs}
+        configs.update(environ)
+        return configs
 
     def replace_vars(self, data: Any, default: Any = None) -> Any:
-        """Recursively replaces environment variables in the data."""
-        if isinstance(data, dict):
-            return {key: self.replace_vars(value, default) for key, value in data.items()}
-        if isinstance(data, list):
-            return [self.replace_vars(item, default) for item in data]
+        """Recursively replaces environment variables in the data.
+
+        Dicts and lists without replaced values are returned as is, and nodes shared in
+        the data (e.g. YAML aliases) are processed once and stay shared in the result.
+        """
+        return self._replace_vars(data, default, {})
+
+    def _replace_vars(self, data: Any, default: Any, memo: Dict[int, Tuple[Any, Any]]) -> Any:
         if isinstance(data, str):
             return self.replace_var(data, default)
-        return data
+        if not isinstance(data, (dict, list)):
+            return data
+        cached = memo.get(id(data))
+        if cached is not None:
+            return cached[1]
+        result = data
+        for key, value in data.items() if isinstance(data, dict) else enumerate(data):
+            replaced = self._replace_vars(value, default, memo)
+            if replaced is not value:
+                if result is data:
+                    result = data.copy()
+                result[key] = replaced
+        # The input is kept in the memo so its id is not reused during the pass
+        memo[id(data)] = (data, result)
+        return result
 
     def replace_var(self, value: str, default: Any = None) -> Optional[str]:
         """Replaces ${VAR_NAME} or ${VAR_NAME:default} with the value of an environment variable."""
@@ -36,17 +169,56 @@ class Env:
                 else str(var_default) if var_default is not None else ""
             )
 
+        if "${" not in value:
+            return value if value != "" else None
+
         result = self.ENV_VAR_PATTERN.sub(replace_match, value)
         return result if result != "" else None
 
     def get(self, key: str, default: Any = None) -> Any:
-        return self.env_configs.get(key, default)
+        value = self.env_configs.get(key)
+        if value is None:
+            value = self._get_secret(key)
+        return default if value is None else value
+
+    def _get_secret(self, key: str) -> Optional[str]:
+        if self.secrets is None:
+            return None
+        path = self.env_configs.get(f"{key}_FILE")
+        if path is not None:
+            if path not in self._secret_files:
+                self._secret_files[path] = read_secret(path)
+            return self._secret_files[path]
+        return self.secrets.get(key)
 
     def all(self) -> Dict[str, Any]:
-        return dict(self.env_configs.items())
+        """Returns a copy of the variables, including the files of the secrets directory."""
+        return dict(self.view())
+
+    def view(self) -> Mapping[str, Any]:
+        """Returns a read-only view of the snapshot without copying it, see all()."""
+        if self.secrets is None:
+            return MappingProxyType(self.env_configs)
+        return MappingProxyType({**self.secrets.all(), **self.env_configs})
 
 
 class EnvFactory:
     @staticmethod
-    def create(env_path: Union[Path, str, None] = None) -> Env:
-        return Env(env_path)
+    def create(
+        env_path: EnvPaths = None,
+        isolated: bool = False,
+        override: bool = False,
+        secrets_dir: Union[Path, str, None] = None,
+    ) -> Env:
+        return Env(env_path, isolated, override, secrets_dir)
+
+    @staticmethod
+    def from_source(source: "EnvSource" = None, isolated: bool = False) -> Env:
+        """Returns source if it is an Env, otherwise a new Env for the .env paths."""
+        if isinstance(source, Env):
+            return source
+        return Env(source, isolated)
+
+
+# .env paths, or an Env to use as is (e.g. an isolated one or one with a secrets directory)
+EnvSource = Union[EnvPaths, Env]
@@ -13,3 +13,7 @@ class ValidationError(ConfigError):
 
 class ConfigFileNotFoundError(ConfigError):
     """Exception raised when a configuration file is not found."""
+
+
+class CircularReferenceError(ConfigError):
+    """Exception raised when config references form a cycle."""
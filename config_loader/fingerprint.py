@@ -0,0 +1,111 @@
+import hashlib
+import struct
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from config_loader.compact import NUMERIC_ARRAY_TYPES
+from config_loader.frozen import FrozenArray, FrozenDict
+from config_loader.records import RecordTable
+
+_DIGEST_SIZE = 16
+_CONTAINER_TYPES = (Mapping, list, tuple, set, frozenset, RecordTable) + NUMERIC_ARRAY_TYPES
+# Containers whose digest can be memoized, provided their children are immutable too
+IMMUTABLE_TYPES = (FrozenDict, tuple, frozenset, FrozenArray, RecordTable)
+_SCALAR_ENCODERS: Dict[type, Callable[[Any], bytes]] = {
+    type(None): lambda value: b"n",
+    bool: lambda value: b"b1" if value else b"b0",
+    int: lambda value: b"i" + str(value).encode(),
+    float: lambda value: b"f" + struct.pack("<d", value),
+    bytes: lambda value: b"y" + value,
+    str: lambda value: b"s" + value.encode("utf-8", "surrogatepass"),
+}
+
+
+def _digest(*parts: bytes) -> bytes:
+    return hashlib.blake2b(b"".join(parts), digest_size=_DIGEST_SIZE).digest()
+
+
+def _scalar_digest(value: Any) -> bytes:
+    """Digest of a scalar from a type tag and a canonical encoding of the value."""
+    encoder = _SCALAR_ENCODERS.get(type(value))
+    if encoder is None:
+        return _digest(b"r", type(value).__qualname__.encode(), repr(value).encode())
+    return _digest(encoder(value))
+
+
+class Fingerprinter:
+    """Merkle-style content hashes of config subtrees.
+
+    A container's digest is built from the digests of its children. Digests of
+    immutable subtrees (frozen trees, see freeze()) are memoized by identity (a
+    reference is kept so ids stay valid), so a subtree shared between versions of a tree
+    is hashed once. Mutable containers can change in place and are rehashed on every
+    call. Mapping digests do not depend on key order, and lists, tuples, arrays and
+    record tables with the same items hash the same.
+    """
+
+    def __init__(self, previous: Optional["Fingerprinter"] = None) -> None:
+        self._memo: Dict[int, Tuple[Any, bytes]] = {}
+        # Digests of the previous version of the tree, reused for shared subtrees
+        self._previous = previous._memo if previous is not None else {}
+
+    def fingerprint(self, node: Any) -> str:
+        """Returns the hex content hash of a subtree."""
+        return self.digest(node).hex()
+
+    def digest(self, node: Any) -> bytes:
+        return self._digest(node)[0]
+
+    def forget_previous(self) -> None:
+        """Drops the digests of the previous tree, e.g. once the whole tree has been hashed."""
+        self._previous = {}
+
+    def _digest(self, node: Any) -> Tuple[bytes, bool]:
+        """Returns the digest of a node and whether the node is immutable."""
+        if not isinstance(node, _CONTAINER_TYPES):
+            return _scalar_digest(node), True
+        cached = self._memo.get(id(node)) or self._previous.get(id(node))
+        if cached is not None and cached[0] is node:
+            self._memo[id(node)] = cached
+            return cached[1], True
+        digest, immutable = self._container_digest(node)
+        immutable = immutable and isinstance(node, IMMUTABLE_TYPES)
+        if immutable:
+            self._memo[id(node)] = (node, digest)
+        return digest, immutable
+
+    def _container_digest(self, node: Any) -> Tuple[bytes, bool]:
+        if isinstance(node, Mapping):
+            return self._mapping_digest(node.items())
+        if isinstance(node, (set, frozenset)):
+            digests, immutable = self._digests(node)
+            return _digest(b"e", *sorted(digests)), immutable
+        if isinstance(node, RecordTable):
+            # Rows are hashed directly, the Record views are transient
+            rows = [self._mapping_digest(zip(node.keys, row)) for row in node.rows]
+            return _digest(b"l", *(row for row, _ in rows)), all(flag for _, flag in rows)
+        if isinstance(node, (list, tuple, array, FrozenArray)):
+            digests, immutable = self._digests(node)
+            return _digest(b"l", *digests), immutable
+        # NumPy arrays
+        digests, immutable = self._digests(node.tolist())
+        return _digest(b"l", *digests), immutable
+
+    def _digests(self, nodes: Iterable[Any]) -> Tuple[List[bytes], bool]:
+        digests = []
+        immutable = True
+        for node in nodes:
+            digest, node_immutable = self._digest(node)
+            digests.append(digest)
+            immutable = immutable and node_immutable
+        return digests, immutable
+
+    def _mapping_digest(self, items: Iterable[Tuple[Any, Any]]) -> Tuple[bytes, bool]:
+        pairs = []
+        immutable = True
+        for key, value in items:
+            key_digest, key_immutable = self._digest(key)
+            value_digest, value_immutable = self._digest(value)
+            pairs.append(key_digest + value_digest)
+            immutable = immutable and key_immutable and value_immutable
+        return _digest(b"d", *sorted(pairs)), immutable
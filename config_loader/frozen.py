@@ -0,0 +1,139 @@
+from array import array
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union, overload
+
+from config_loader.records import RecordTable
+
+
+class FrozenDict(Mapping[str, Any]):
+    """Read-only mapping backed by a mapping proxy.
+
+    Hashable when all of its values are hashable, so a frozen config tree can be
+    used as a cache key. Copying returns the same instance.
+    """
+
+    __slots__ = ("_data", "_hash")
+
+    def __init__(self, data: Optional[Mapping[str, Any]] = None) -> None:
+        self._data = MappingProxyType(dict(data or {}))
+        self._hash: Optional[int] = None
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenDict):
+            return self._data == other._data
+        if isinstance(other, Mapping):
+            return dict(self._data) == dict(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict(self._data)!r})"
+
+    def __copy__(self) -> "FrozenDict":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenDict, (dict(self._data),)
+
+
+class FrozenArray(Sequence[Union[int, float]]):
+    """Read-only, hashable wrapper around a compact numeric array.array."""
+
+    __slots__ = ("_array",)
+
+    def __init__(self, data: "array[Any]") -> None:
+        self._array = data
+
+    @property
+    def typecode(self) -> str:
+        return self._array.typecode
+
+    @overload
+    def __getitem__(self, index: int) -> Union[int, float]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "FrozenArray": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, float, "FrozenArray"]:
+        if isinstance(index, slice):
+            return FrozenArray(self._array[index])
+        value: Union[int, float] = self._array[index]
+        return value
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return iter(self._array)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenArray):
+            return self._array == other._array
+        if isinstance(other, array):
+            return self._array == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self._array.typecode, self._array.tobytes()))
+
+    def __repr__(self) -> str:
+        return f"FrozenArray({self._array.typecode!r}, {self._array.tolist()!r})"
+
+    def __copy__(self) -> "FrozenArray":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenArray":
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return FrozenArray, (self._array,)
+
+    def tolist(self) -> List[Union[int, float]]:
+        return self._array.tolist()
+
+
+def freeze(data: Any) -> Any:
+    """Recursively converts dicts to FrozenDict, lists to tuples and sets to frozensets.
+
+    Numeric arrays become FrozenArray, NumPy arrays read-only views; RecordTable values
+    are frozen in place of the table.
+    """
+    if isinstance(data, (FrozenDict, FrozenArray)):
+        return data
+    if isinstance(data, RecordTable):
+        return data.map_values(freeze)
+    if isinstance(data, Mapping):
+        return FrozenDict({key: freeze(value) for key, value in data.items()})
+    if isinstance(data, (list, tuple, set, frozenset)):
+        items = (freeze(item) for item in data)
+        return tuple(items) if isinstance(data, (list, tuple)) else frozenset(items)
+    return _freeze_array(data)
+
+
+def _freeze_array(data: Any) -> Any:
+    if isinstance(data, array):
+        return FrozenArray(array(data.typecode, data))
+    if hasattr(data, "setflags"):  # NumPy array
+        view = data.view()
+        view.setflags(write=False)
+        return view
+    return data
@@ -0,0 +1,88 @@
+from typing import Any, Dict, List, Mapping, Sequence, Tuple, cast
+
+from config_loader.merge import DeepMerger
+
+_MISSING = object()
+
+
+class LayerStack:
+    """Configuration layers (lowest priority first) resolved lazily as one deep-merged tree.
+
+    Mappings are merged key by key, any other value replaces the values of lower layers.
+    Lookups walk the layers path by path and are memoized; merged subtrees are only
+    materialized when a path resolving to a mapping is requested.
+    """
+
+    def __init__(self, layers: Sequence[Mapping[str, Any]]) -> None:
+        self.layers: List[Mapping[str, Any]] = list(layers) or [{}]
+        self._memo: Dict[str, Any] = {}
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._memo.get(key, _MISSING)
+        if value is _MISSING:
+            value = self._resolve(key.split(".") if key else [])
+            self._memo[key] = value
+        return default if value is _MISSING else value
+
+    def all(self) -> Dict[str, Any]:
+        return cast(Dict[str, Any], self.get("", {}))
+
+    def set_layer(self, index: int, layer: Mapping[str, Any]) -> None:
+        """Replaces a layer, invalidating only memoized paths the old or new layer defines."""
+        previous = self.layers[index]
+        self.layers[index] = layer
+        for key in list(self._memo):
+            steps = key.split(".") if key else []
+            if _defines(previous, steps) or _defines(layer, steps):
+                del self._memo[key]
+
+    def _resolve(self, steps: List[str]) -> Any:
+        mappings: List[Mapping[str, Any]] = []
+        for layer in reversed(self.layers):
+            value, authoritative = _walk(layer, steps)
+            if value is _MISSING and not authoritative:
+                continue
+            if authoritative or not isinstance(value, Mapping):
+                # A value that is not merged hides the lower layers.
+                if mappings:
+                    break
+                return value
+            mappings.append(value)
+        if not mappings:
+            return _MISSING
+        return merge_mappings(mappings[::-1])
+
+
+def merge_mappings(mappings: Sequence[Mapping[str, Any]]) -> Any:
+    """Deep-merges mappings (lowest priority first); a single mapping is returned as is."""
+    return DeepMerger().merge_all(mappings)
+
+
+def _walk(layer: Any, steps: List[str]) -> Tuple[Any, bool]:
+    """Walks a path in one layer.
+
+    Returns the value (or _MISSING) and whether the layer is authoritative for the path,
+    i.e. the walk left the mappings that are merged with lower layers.
+    """
+    node = layer
+    for position, step in enumerate(steps):
+        if isinstance(node, Mapping):
+            if step not in node:
+                return _MISSING, False
+            node = node[step]
+            continue
+        if not isinstance(node, (list, tuple)):
+            return _MISSING, True
+        try:
+            index = int(step)
+        except ValueError:
+            return _MISSING, True
+        if not 0 <= index < len(node):
+            return _MISSING, True
+        return _walk(node[index], steps[position + 1 :])[0], True
+    return node, False
+
+
+def _defines(layer: Any, steps: List[str]) -> bool:
+    value, authoritative = _walk(layer, steps)
+    return authoritative or value is not _MISSING
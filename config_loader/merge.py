@@ -0,0 +1,112 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+from config_loader.exceptions import ConfigError
+
+
+class ListStrategy(Enum):
+    REPLACE = "replace"
+    APPEND = "append"
+    MERGE_BY_KEY = "merge_by_key"
+
+
+class DeepMerger:
+    """Deep-merges config trees; mappings are merged key by key, lists by the list strategy.
+
+    Subtrees present in only one input are reused without copying. A container is copied
+    at most once, the first time another tree is merged into it; the copy is then updated
+    in place, so folding many trees costs time linear in their total size. Inputs are
+    never modified.
+    """
+
+    def __init__(
+        self, list_strategy: ListStrategy = ListStrategy.REPLACE, merge_key: Optional[str] = None
+    ) -> None:
+        if list_strategy is ListStrategy.MERGE_BY_KEY and merge_key is None:
+            raise ConfigError("The merge_by_key list strategy requires a merge_key")
+        self.list_strategy = list_strategy
+        self.merge_key = merge_key
+        self._owned: Dict[int, Any] = {}
+        self._key_positions: Dict[int, Dict[Any, int]] = {}
+
+    def merge(self, base: Any, override: Any) -> Any:
+        """Returns base with override merged into it."""
+        return self.merge_all((base, override))
+
+    def merge_all(self, trees: Iterable[Any]) -> Any:
+        """Folds trees into one in a single pass, later trees taking priority."""
+        # Copies are owned for one call only: once returned, the result belongs to the caller
+        self._owned, self._key_positions = {}, {}
+        try:
+            result: Any = {}
+            for position, tree in enumerate(trees):
+                result = tree if position == 0 else self._merge(result, tree)
+            return result
+        finally:
+            self._owned, self._key_positions = {}, {}
+
+    def _merge(self, base: Any, override: Any) -> Any:
+        if isinstance(base, Mapping) and isinstance(override, Mapping):
+            return self._merge_mappings(base, override)
+        if (
+            self.list_strategy is not ListStrategy.REPLACE
+            and isinstance(base, (list, tuple))
+            and isinstance(override, (list, tuple))
+        ):
+            return self._merge_lists(base, override)
+        return override
+
+    def _mutable(self, node: Any, factory: Callable[[Any], Any]) -> Any:
+        """Returns the node if this merger created it, otherwise a copy it owns."""
+        if id(node) in self._owned:
+            return node
+        copy = factory(node)
+        self._owned[id(copy)] = copy
+        return copy
+
+    def _merge_mappings(self, base: Mapping[str, Any], override: Mapping[str, Any]) -> Any:
+        if not override:
+            return base
+        result = self._mutable(base, dict)
+        for key, value in override.items():
+            result[key] = self._merge(result[key], value) if key in result else value
+        return result
+
+    def _merge_lists(self, base: Any, override: Any) -> List[Any]:
+        result: List[Any] = self._mutable(base, list)
+        if self.list_strategy is ListStrategy.APPEND:
+            result.extend(override)
+            return result
+        positions = self._positions(result)
+        for item in override:
+            if not isinstance(item, Mapping) or self.merge_key not in item:
+                result.append(item)
+                continue
+            index = positions.get(item[self.merge_key])
+            if index is None:
+                positions[item[self.merge_key]] = len(result)
+                result.append(item)
+            else:
+                result[index] = self._merge(result[index], item)
+        return result
+
+    def _positions(self, items: List[Any]) -> Dict[Any, int]:
+        """Returns the merge key -> position index of an owned list, built once."""
+        positions = self._key_positions.get(id(items))
+        if positions is None:
+            positions = {}
+            for index, item in enumerate(items):
+                if isinstance(item, Mapping) and self.merge_key in item:
+                    positions.setdefault(item[self.merge_key], index)
+            self._key_positions[id(items)] = positions
+        return positions
+
+
+def deep_merge(
+    base: Any,
+    override: Any,
+    list_strategy: ListStrategy = ListStrategy.REPLACE,
+    merge_key: Optional[str] = None,
+) -> Any:
+    """Deep-merges override into base without modifying either."""
+    return DeepMerger(list_strategy, merge_key).merge(base, override)
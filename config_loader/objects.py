@@ -0,0 +1,80 @@
+import keyword
+from typing import Any, Dict, Mapping, Optional, Tuple, Type
+
+from config_loader.records import RecordTable
+
+_SHAPE_CLASSES: Dict[Tuple[str, ...], Type["ConfigObject"]] = {}
+
+
+class ConfigObject:
+    """Read-only attribute access to a config mapping.
+
+    Subclasses are generated per key shape and only declare __slots__, so records
+    sharing the same keys share one class and carry no per-instance dict.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, *values: Any) -> None:
+        for name, value in zip(self.__slots__, values):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConfigObject):
+            return NotImplemented
+        return self.__slots__ == other.__slots__ and all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.__slots__, tuple(getattr(self, name) for name in self.__slots__)))
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+def _is_attribute_name(key: Any) -> bool:
+    return (
+        isinstance(key, str)
+        and key.isidentifier()
+        and not keyword.iskeyword(key)
+        and not key.startswith("_")
+    )
+
+
+def shape_class(keys: Tuple[str, ...]) -> Optional[Type[ConfigObject]]:
+    """Returns the ConfigObject subclass for the key shape, or None if keys aren't attributes."""
+    cls = _SHAPE_CLASSES.get(keys)
+    if cls is None:
+        if not all(_is_attribute_name(key) for key in keys):
+            return None
+        cls = type("ConfigObject", (ConfigObject,), {"__slots__": keys})
+        cls = _SHAPE_CLASSES.setdefault(keys, cls)
+    return cls
+
+
+def to_object(data: Any) -> Any:
+    """Recursively converts mappings to ConfigObject instances and lists to tuples.
+
+    Mappings whose keys are not valid attribute names are kept as dicts.
+    """
+    if isinstance(data, Mapping):
+        keys = tuple(data)
+        values = [to_object(value) for value in data.values()]
+        cls = shape_class(keys)
+        if cls is None:
+            return dict(zip(keys, values))
+        return cls(*values)
+    if isinstance(data, (list, tuple, RecordTable)):
+        return tuple(to_object(item) for item in data)
+    return data
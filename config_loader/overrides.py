@@ -0,0 +1,119 @@
+import re
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+from config_loader.exceptions import ConfigError
+from config_loader.persistent import PathCopier
+
+_INT_PATTERN = re.compile(r"[-+]?(0|[1-9][0-9]*)")
+_FLOAT_PATTERN = re.compile(r"[-+]?([0-9]+\.[0-9]*|\.[0-9]+|[0-9]+(?=[eE]))([eE][-+]?[0-9]+)?")
+_CONSTANTS = {"true": True, "false": False, "null": None}
+
+
+class EnvOverrides:
+    """Maps prefixed environment variables to config paths.
+
+    With prefix 'APP' and separator '__', APP__DB__HOST overrides db.host. Path segments
+    are lowercased by tree(); apply() matches them case-insensitively against the existing
+    keys and reads numeric segments as list indices. With coerce, true, false, null and
+    decimal numbers are converted (e.g. '5432' -> 5432, 'true' -> True); other values,
+    including ones YAML 1.1 would convert such as 'no', '01234' or '12:30', stay strings.
+    """
+
+    def __init__(self, prefix: str, separator: str = "__", coerce: bool = True) -> None:
+        if not separator:
+            raise ConfigError("Environment override separator must not be empty")
+        self.prefix = prefix
+        self.separator = separator
+        self.coerce = coerce
+
+    def tree(self, environ: Mapping[str, str]) -> Dict[str, Any]:
+        """Builds the override tree in a single pass over the environment.
+
+        Raises:
+            ConfigError: If one variable overrides a value another one extends
+        """
+        start = self.prefix + self.separator
+        tree: Dict[str, Any] = {}
+        for name in sorted(name for name in environ if name.startswith(start)):
+            path = [segment.lower() for segment in name[len(start) :].split(self.separator)]
+            if not all(path):
+                continue
+            _insert(tree, path, self._value(environ[name]), name)
+        return tree
+
+    def apply(self, configs: Any, environ: Mapping[str, str]) -> Any:
+        """Returns configs with the overrides from environ set in place.
+
+        Raises:
+            ConfigError: On conflicting overrides or an invalid or out-of-range list index
+        """
+        copier = PathCopier()
+        for path, value in _leaves(self.tree(environ), ()):
+            steps, value = _resolve(configs, path, value)
+            configs = copier.set_at(configs, steps, value)
+        return configs
+
+    def _value(self, value: str) -> Any:
+        if not self.coerce:
+            return value
+        if value.lower() in _CONSTANTS:
+            return _CONSTANTS[value.lower()]
+        if _INT_PATTERN.fullmatch(value):
+            return int(value)
+        if _FLOAT_PATTERN.fullmatch(value):
+            return float(value)
+        return value
+
+
+def _insert(tree: Dict[str, Any], path: Any, value: Any, name: str) -> None:
+    node = tree
+    for segment in path[:-1]:
+        node = node.setdefault(segment, {})
+        if not isinstance(node, dict):
+            raise ConfigError(f"Environment override {name} conflicts with a scalar override")
+    if isinstance(node.get(path[-1]), dict):
+        raise ConfigError(f"Environment override {name} conflicts with nested overrides")
+    node[path[-1]] = value
+
+
+def _leaves(tree: Dict[str, Any], path: Tuple[str, ...]) -> List[Tuple[Tuple[str, ...], Any]]:
+    leaves = []
+    for segment, value in tree.items():
+        if isinstance(value, dict):
+            leaves.extend(_leaves(value, path + (segment,)))
+        else:
+            leaves.append((path + (segment,), value))
+    return leaves
+
+
+def _resolve(node: Any, path: Tuple[str, ...], value: Any) -> Tuple[List[Any], Any]:
+    steps: List[Any] = []
+    for position, segment in enumerate(path):
+        if isinstance(node, Mapping):
+            key = _match_key(node, segment)
+            steps.append(key)
+            node = node.get(key)
+        elif isinstance(node, Sequence) and not isinstance(node, (str, bytes)):
+            steps.append(segment)
+            node = node[_index(node, segment)]
+        else:
+            # Overriding below a scalar replaces it with a mapping, as a deep merge would.
+            for rest in reversed(path[position:]):
+                value = {rest: value}
+            return steps, value
+    return steps, value
+
+
+def _match_key(node: Mapping, segment: str) -> Any:
+    if segment in node:
+        return segment
+    for key in node:
+        if str(key).lower() == segment:
+            return key
+    return segment
+
+
+def _index(node: Any, segment: str) -> int:
+    if not segment.isdigit() or int(segment) >= len(node):
+        raise ConfigError(f"Invalid list index '{segment}' in environment override")
+    return int(segment)
@@ -0,0 +1,40 @@
+import re
+from functools import lru_cache
+from typing import NamedTuple, Tuple, Union
+
+_TOKEN_PATTERN = re.compile(
+    r"\[(?P<field>[^=\]]+)=(?P<value>[^\]]*)\]|(?P<key>[^.\[\]]+)|\."
+)  # Regexp: key | [field=value] | .
+
+
+class Selector(NamedTuple):
+    """Path step selecting the record whose field equals value in the list at list_path."""
+
+    list_path: str
+    field: str
+    value: str
+
+
+PathStep = Union[str, Selector]
+
+
+@lru_cache(maxsize=4096)
+def parse_path(path: str) -> Tuple[PathStep, ...]:
+    """Parses a dot path with record selectors (e.g. 'upstreams[name=payments].timeout').
+
+    Paths that are not valid selector syntax are split on dots, as plain keys.
+    """
+    steps = []
+    position = 0
+    for match in _TOKEN_PATTERN.finditer(path):
+        if match.start() != position:
+            return tuple(path.split("."))
+        position = match.end()
+        if match.group("key") is not None:
+            steps.append(match.group("key"))
+        elif match.group("field") is not None:
+            list_path = path[: match.start()].rstrip(".")
+            steps.append(Selector(list_path, match.group("field"), match.group("value")))
+    if position != len(path):
+        return tuple(path.split("."))
+    return tuple(steps)
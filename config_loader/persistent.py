@@ -0,0 +1,114 @@
+from array import array
+from typing import Any, Dict, Mapping, Sequence
+
+from config_loader.exceptions import ConfigError
+from config_loader.frozen import FrozenArray, FrozenDict, freeze
+from config_loader.paths import Selector, parse_path
+from config_loader.records import Record, RecordTable
+
+
+class PathCopier:
+    """Applies updates to a config tree by copying only the containers on each path.
+
+    The input tree is never modified, so readers of it are undisturbed and all other
+    subtrees are shared with the result. Mutable containers created by this copier
+    are updated in place by later updates of the same batch.
+    """
+
+    def __init__(self) -> None:
+        self._owned: Dict[int, Any] = {}
+
+    def set(self, tree: Any, path: str, value: Any) -> Any:
+        """Returns a tree with the value at path replaced, creating missing mappings.
+
+        Raises:
+            ConfigError: If the path goes through a scalar or a missing list item
+        """
+        steps = parse_path(path) if "[" in path else tuple(path.split("."))
+        return self.set_at(tree, steps, value)
+
+    def set_at(self, tree: Any, steps: Sequence[Any], value: Any) -> Any:
+        """Like set(), with the path given as a sequence of keys (e.g. non-string keys)."""
+        if isinstance(tree, FrozenDict):
+            value = freeze(value)
+        return self._set(tree, steps, 0, value)
+
+    def _set(self, node: Any, steps: Any, position: int, value: Any) -> Any:
+        if position == len(steps):
+            return value
+        step = steps[position]
+        if isinstance(step, Selector):
+            key: Any = _find_record(node, step)
+        elif isinstance(node, Mapping):
+            key = step
+        else:
+            key = _list_index(node, step)
+        child = _get_child(node, key)
+        new_child = self._set(child, steps, position + 1, value)
+        if new_child is child:
+            return node
+        return self._replace(node, key, new_child)
+
+    def _replace(self, node: Any, key: Any, child: Any) -> Any:
+        if id(node) in self._owned and isinstance(node, (dict, list)):
+            node[key] = child
+            return node
+        if isinstance(node, (FrozenDict, Record)):
+            return _replace_record(node, key, child)
+        if isinstance(node, Mapping):
+            result: Any = dict(node)
+        elif isinstance(node, RecordTable):
+            return _replace_row(node, key, child)
+        elif isinstance(node, tuple):
+            return node[:key] + (child,) + node[key + 1 :]
+        elif isinstance(node, (array, FrozenArray)):
+            copied = array(node.typecode, node)
+            copied[key] = child
+            return FrozenArray(copied) if isinstance(node, FrozenArray) else copied
+        else:
+            result = list(node)
+        result[key] = child
+        self._owned[id(result)] = result
+        return result
+
+
+def _replace_record(node: Any, key: Any, child: Any) -> Any:
+    if isinstance(node, Record):
+        if key not in node:
+            raise ConfigError(f"Cannot add key '{key}' to a record table row")
+        return {**node, key: child}
+    return FrozenDict({**node, key: child})
+
+
+def _replace_row(table: RecordTable, index: int, row: Any) -> RecordTable:
+    if not isinstance(row, Mapping) or set(row) != set(table.keys):
+        raise ConfigError(f"Record table rows must be mappings with the keys {list(table.keys)}")
+    rows = list(table.rows)
+    rows[index] = tuple(row[name] for name in table.keys)
+    return RecordTable(table.keys, rows)
+
+
+def _get_child(node: Any, key: Any) -> Any:
+    if isinstance(node, Mapping):
+        return node.get(key, {} if isinstance(node, dict) else FrozenDict())
+    return node[key]
+
+
+def _list_index(node: Any, step: str) -> int:
+    if isinstance(node, (str, bytes)) or not hasattr(node, "__getitem__"):
+        raise ConfigError(f"Cannot set '{step}' on a scalar value")
+    try:
+        index = int(step)
+    except ValueError as e:
+        raise ConfigError(f"Invalid list index '{step}'") from e
+    if not 0 <= index < len(node):
+        raise ConfigError(f"List index {index} out of range")
+    return index
+
+
+def _find_record(node: Any, selector: Selector) -> int:
+    if isinstance(node, (list, tuple, RecordTable)):
+        for index, record in enumerate(node):
+            if isinstance(record, Mapping) and str(record.get(selector.field)) == selector.value:
+                return index
+    raise ConfigError(f"No record with {selector.field}={selector.value} in {selector.list_path}")
@@ -0,0 +1,92 @@
+from typing import Any, Callable, Iterator, List, Mapping, Sequence, Tuple, Union, overload
+
+
+class RecordTable(Sequence["Record"]):
+    """Read-only column-wise storage for a list of records sharing the same keys.
+
+    The keys are stored once and each record is a tuple of values, so records do not
+    carry their own hash tables. Items are exposed as lightweight Record mappings.
+    """
+
+    __slots__ = ("keys", "rows", "positions")
+
+    def __init__(self, keys: Tuple[str, ...], rows: Sequence[Tuple[Any, ...]]) -> None:
+        self.keys = keys
+        self.rows = tuple(rows)
+        self.positions = {key: position for position, key in enumerate(keys)}
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> "RecordTable":
+        keys = tuple(records[0]) if records else ()
+        return cls(keys, [tuple(record.values()) for record in records])
+
+    @overload
+    def __getitem__(self, index: int) -> "Record": ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "RecordTable": ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union["Record", "RecordTable"]:
+        if isinstance(index, slice):
+            return RecordTable(self.keys, self.rows[index])
+        return Record(self, self.rows[index])
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator["Record"]:
+        for row in self.rows:
+            yield Record(self, row)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, RecordTable):
+            return self.keys == other.keys and self.rows == other.rows
+        if isinstance(other, (list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash((self.keys, self.rows))
+
+    def __repr__(self) -> str:
+        return f"RecordTable(keys={self.keys!r}, rows={len(self.rows)})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return RecordTable, (self.keys, self.rows)
+
+    def column(self, key: str) -> List[Any]:
+        """Returns all values of one key, for fast bulk scans."""
+        position = self.positions[key]
+        return [row[position] for row in self.rows]
+
+    def map_values(self, func: Callable[[Any], Any]) -> "RecordTable":
+        """Returns a table with func applied to every value."""
+        return RecordTable(self.keys, [tuple(map(func, row)) for row in self.rows])
+
+
+class Record(Mapping[str, Any]):
+    """Read-only mapping view of one row of a RecordTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: RecordTable, row: Tuple[Any, ...]) -> None:
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        return self._row[self._table.positions[key]]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._table.positions
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.keys)
+
+    def __len__(self) -> int:
+        return len(self._row)
+
+    def __hash__(self) -> int:
+        return hash((self._table.keys, self._row))
+
+    def __repr__(self) -> str:
+        return f"Record({dict(zip(self._table.keys, self._row))!r})"
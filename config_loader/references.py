@@ -0,0 +1,209 @@
+import re
+from bisect import bisect_left
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+
+from config_loader.diff import diff_trees
+from config_loader.exceptions import CircularReferenceError, ConfigError
+from config_loader.persistent import PathCopier
+
+REFERENCE_PATTERN = re.compile(r"\$\{config:([^}]+)\}")  # Regexp: ${config:path.to.value}
+
+_MISSING = object()
+# Concrete types are checked first, the Mapping ABC check is slow for plain scalars
+_CONTAINER_TYPES = (dict, list, tuple)
+_SCALAR_TYPES = (int, float, bytes, type(None))
+
+
+# Path of a referencing string: the keys and indexes leading to it, as they are in the tree
+Path = Tuple[Any, ...]
+
+
+class ReferenceResolver:
+    """Resolves ${config:path} references between config values.
+
+    Referencing strings are evaluated in dependency order, each once, and references
+    forming a cycle raise CircularReferenceError. A string consisting of a single
+    reference takes the referenced value as is, otherwise values are formatted into it.
+
+    Resolved values are cached: resolving the next version of a tree re-evaluates only
+    references whose text changed or which depend, directly or transitively, on a
+    changed path.
+
+    References are resolved by ConfigFactory.create_by_path() and, on request, create();
+    templated and lazy collections (and so ConfigCollection.apply_env()) keep them as is.
+    """
+
+    def __init__(self) -> None:
+        self.locations: Dict[Path, str] = {}
+        self.values: Dict[Path, Any] = {}
+        self._dependencies: Dict[Path, List[Path]] = {}
+        self._raw: Any = None
+
+    def resolve(self, tree: Any) -> Any:
+        """Returns the tree with all references resolved; the tree is not modified.
+
+        Raises:
+            CircularReferenceError: If references form a cycle
+            ConfigError: If a reference points to a missing path
+        """
+        locations: Dict[Path, str] = {}
+        _scan(tree, (), locations)
+        stale = self._stale(tree, locations)
+        # Until resolving succeeds the cache can't be trusted for the next version
+        self.locations, self._raw = locations, None
+        self.values = {path: self.values[path] for path in locations if path not in stale}
+        if not locations:
+            self._raw = tree
+            return tree
+
+        copier = PathCopier()
+        resolved = tree
+        for path, value in self.values.items():
+            resolved = copier.set_at(resolved, path, value)
+        visiting: List[Path] = []
+        for path in sorted(stale, key=_dotted):
+            resolved = self._evaluate(path, resolved, copier, visiting)
+        self._raw = tree
+        return resolved
+
+    def _stale(self, tree: Any, locations: Dict[Path, str]) -> Set[Path]:
+        """Returns the locations to re-evaluate and rebuilds the dependency edges."""
+        sorted_paths = sorted(((_dotted(path), path) for path in locations), key=_first)
+        self._dependencies = {
+            path: _dependencies(REFERENCE_PATTERN.findall(template), sorted_paths)
+            for path, template in locations.items()
+        }
+        if self._raw is None:
+            return set(locations)
+        changed = {change.path for change in diff_trees(self._raw, tree)}
+        changed_prefixes = {prefix for path in changed for prefix in _prefixes(path)}
+        stale = {
+            path
+            for path, template in locations.items()
+            if self.locations.get(path) != template
+            or any(
+                _overlaps(target, changed, changed_prefixes)
+                for target in REFERENCE_PATTERN.findall(template)
+            )
+        }
+        dependents: Dict[Path, List[Path]] = {}
+        for path, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                dependents.setdefault(dependency, []).append(path)
+        pending = list(stale)
+        while pending:
+            for dependent in dependents.get(pending.pop(), []):
+                if dependent not in stale:
+                    stale.add(dependent)
+                    pending.append(dependent)
+        return stale
+
+    def _evaluate(self, path: Path, tree: Any, copier: PathCopier, visiting: List[Path]) -> Any:
+        if path in self.values:
+            return tree
+        if path in visiting:
+            cycle = visiting[visiting.index(path) :] + [path]
+            raise CircularReferenceError(
+                f"Circular config reference: {' -> '.join(map(_dotted, cycle))}"
+            )
+        visiting.append(path)
+        for dependency in self._dependencies[path]:
+            tree = self._evaluate(dependency, tree, copier, visiting)
+        visiting.pop()
+        value = self._render(path, tree)
+        self.values[path] = value
+        return copier.set_at(tree, path, value)
+
+    def _render(self, path: Path, tree: Any) -> Any:
+        template = self.locations[path]
+
+        def lookup(target: str) -> Any:
+            value = _lookup(tree, target)
+            if value is _MISSING:
+                raise ConfigError(
+                    f"Reference to missing config path '{target}' at '{_dotted(path)}'"
+                )
+            return value
+
+        match = REFERENCE_PATTERN.fullmatch(template)
+        if match is not None:
+            return lookup(match.group(1))
+        return REFERENCE_PATTERN.sub(lambda item: str(lookup(item.group(1))), template)
+
+
+def resolve_references(tree: Any) -> Any:
+    """Returns the tree with all ${config:path} references resolved, see ReferenceResolver."""
+    return ReferenceResolver().resolve(tree)
+
+
+def _dotted(path: Path) -> str:
+    return ".".join(map(str, path))
+
+
+def _first(item: Tuple[str, Path]) -> str:
+    return item[0]
+
+
+def _scan(node: Any, path: Path, locations: Dict[Path, str]) -> None:
+    if isinstance(node, Mapping):
+        items: Any = node.items()
+    elif isinstance(node, (list, tuple)):
+        items = enumerate(node)
+    else:
+        return
+    for key, value in items:
+        if isinstance(value, str):
+            if "${config:" in value and REFERENCE_PATTERN.search(value):
+                locations[path + (key,)] = value
+        elif isinstance(value, _CONTAINER_TYPES) or (
+            not isinstance(value, _SCALAR_TYPES) and isinstance(value, Mapping)
+        ):
+            _scan(value, path + (key,), locations)
+
+
+def _dependencies(targets: List[str], sorted_paths: List[Tuple[str, Path]]) -> List[Path]:
+    """Returns the referencing locations at, under or above the target paths.
+
+    A referencing ancestor (e.g. y for ${config:y.z}) must be evaluated first, as it
+    turns into the value the target is looked up in.
+    """
+    dependencies = []
+    for target in targets:
+        for prefix in _prefixes(target)[:-1]:
+            position = bisect_left(sorted_paths, (prefix,))
+            while position < len(sorted_paths) and sorted_paths[position][0] == prefix:
+                dependencies.append(sorted_paths[position][1])
+                position += 1
+        position = bisect_left(sorted_paths, (target,))
+        while position < len(sorted_paths) and sorted_paths[position][0].startswith(target):
+            candidate, path = sorted_paths[position]
+            if candidate == target or candidate[len(target)] == ".":
+                dependencies.append(path)
+            position += 1
+    return dependencies
+
+
+def _prefixes(path: str) -> List[str]:
+    parts = path.split(".")
+    return [".".join(parts[:length]) for length in range(1, len(parts) + 1)]
+
+
+def _overlaps(target: str, changed: Set[str], changed_prefixes: Set[str]) -> bool:
+    """Whether a changed path is the target, inside it or one of its parents."""
+    return target in changed_prefixes or any(prefix in changed for prefix in _prefixes(target))
+
+
+def _lookup(tree: Any, path: str) -> Any:
+    node: Optional[Any] = tree
+    for step in path.split("."):
+        if isinstance(node, Mapping):
+            # Keys are written as text in references, YAML may have parsed them as ints
+            fallback = node.get(int(step), _MISSING) if step.isdigit() else _MISSING
+            node = node.get(step, fallback)
+        elif isinstance(node, (list, tuple)) and step.isdigit() and int(step) < len(node):
+            node = node[int(step)]
+        else:
+            return _MISSING
+        if node is _MISSING:
+            return _MISSING
+    return node
@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# Symlink Kubernetes swaps atomically to publish a new version of a mounted volume
+DATA_LINK = "..data"
+_SEPARATORS = tuple(sep for sep in ("/", os.sep, os.altsep) if sep)
+
+
+def read_secret(path: Union[Path, str]) -> Optional[str]:
+    """Reads a secret file, dropping the trailing newline; None if it can't be read."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().rstrip("\r\n")
+    except OSError:
+        return None
+
+
+def _is_file_name(name: str) -> bool:
+    """Whether a name is a plain, visible file name, so lookups stay inside the directory."""
+    return bool(name) and not name.startswith(".") and not any(sep in name for sep in _SEPARATORS)
+
+
+class SecretsDirectory:
+    """Directory of mounted secrets, one file per variable (e.g. a Kubernetes secret volume).
+
+    Files are read lazily on first access and cached. check() detects updates through the
+    '..data' symlink swapped on every update, so the whole directory is re-checked with a
+    single readlink. Directories without it fall back to their modification time, which
+    only catches added or removed files.
+    """
+
+    def __init__(self, path: Union[Path, str]) -> None:
+        self.path = Path(path)
+        self.version = self._version()
+        self._values: Dict[str, Optional[str]] = {}
+        self._names: Optional[List[str]] = None
+
+    def get(self, name: str) -> Optional[str]:
+        """Returns the value of a variable; names of hidden files or other paths give None."""
+        if name not in self._values:
+            self._values[name] = read_secret(self.path / name) if _is_file_name(name) else None
+        return self._values[name]
+
+    def names(self) -> List[str]:
+        """Returns the variable names, i.e. the regular files of the directory."""
+        if self._names is None:
+            try:
+                entries = sorted(os.listdir(self.path))
+            except OSError:
+                entries = []
+            self._names = [
+                name
+                for name in entries
+                if not name.startswith(".") and os.path.isfile(self.path / name)
+            ]
+        return self._names
+
+    def all(self) -> Dict[str, str]:
+        values = {name: self.get(name) for name in self.names()}
+        return {name: value for name, value in values.items() if value is not None}
+
+    def check(self) -> bool:
+        """Drops the cached files if the directory was updated; returns whether it was."""
+        version = self._version()
+        if version == self.version:
+            return False
+        self.version = version
+        self._values.clear()
+        self._names = None
+        return True
+
+    def _version(self) -> Optional[str]:
+        try:
+            return os.readlink(self.path / DATA_LINK)
+        except OSError:
+            pass
+        try:
+            return str(os.stat(self.path).st_mtime_ns)
+        except OSError:
+            return None
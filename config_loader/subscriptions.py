@@ -0,0 +1,110 @@
+import logging
+from itertools import count
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from config_loader.diff import ConfigChange
+
+logger = logging.getLogger(__name__)
+
+WILDCARD = "*"
+
+ChangeCallback = Callable[[List[ConfigChange]], Any]
+
+
+class Subscription:
+    """Registration of a callback for changes under a path pattern."""
+
+    __slots__ = ("pattern", "callback", "order", "_trie")
+
+    def __init__(
+        self, pattern: str, callback: ChangeCallback, order: int, trie: "SubscriptionTrie"
+    ) -> None:
+        self.pattern = pattern
+        self.callback = callback
+        self.order = order
+        self._trie = trie
+
+    def cancel(self) -> None:
+        self._trie.remove(self)
+
+
+class _Node:
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "_Node"] = {}
+        self.subscriptions: List[Subscription] = []
+
+    def walk(self) -> Iterator[Subscription]:
+        yield from self.subscriptions
+        for child in self.children.values():
+            yield from child.walk()
+
+
+class SubscriptionTrie:
+    """Subscriptions indexed by the segments of their dot-notation patterns.
+
+    A '*' segment matches any single key. A pattern matches a change at a path inside
+    the subtree it selects, or at a parent path replacing that subtree. Matching walks
+    only the trie branches named by the changed paths.
+    """
+
+    def __init__(self) -> None:
+        self._root = _Node()
+        self._order = count()
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, pattern: str, callback: ChangeCallback) -> Subscription:
+        node = self._root
+        for segment in _segments(pattern):
+            node = node.children.setdefault(segment, _Node())
+        subscription = Subscription(pattern, callback, next(self._order), self)
+        node.subscriptions.append(subscription)
+        self._size += 1
+        return subscription
+
+    def remove(self, subscription: Subscription) -> None:
+        node: Optional[_Node] = self._root
+        for segment in _segments(subscription.pattern):
+            node = node.children.get(segment) if node is not None else None
+        if node is not None and subscription in node.subscriptions:
+            node.subscriptions.remove(subscription)
+            self._size -= 1
+
+    def match(self, path: str) -> Iterator[Subscription]:
+        """Yields the subscriptions matching a change at path."""
+        nodes = [self._root]
+        for segment in _segments(path):
+            next_nodes: List[_Node] = []
+            for node in nodes:
+                yield from node.subscriptions
+                next_nodes.extend(
+                    child
+                    for child in (node.children.get(segment), node.children.get(WILDCARD))
+                    if child is not None
+                )
+            nodes = next_nodes
+        for node in nodes:
+            yield from node.walk()
+
+    def notify(self, changes: List[ConfigChange]) -> None:
+        """Calls each matching subscription once with its changes, in subscription order.
+
+        Errors raised by callbacks are logged and do not stop the other deliveries.
+        """
+        matched: Dict[Subscription, List[ConfigChange]] = {}
+        for change in changes:
+            for subscription in self.match(change.path):
+                matched.setdefault(subscription, []).append(change)
+        for subscription in sorted(matched, key=lambda item: item.order):
+            try:
+                subscription.callback(matched[subscription])
+            except Exception:  # pylint: disable=broad-exception-caught
+                logger.exception("Config change callback for '%s' failed", subscription.pattern)
+
+
+def _segments(path: str) -> List[str]:
+    return path.split(".") if path else []
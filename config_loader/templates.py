@@ -0,0 +1,181 @@
+from functools import lru_cache
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
+
+from config_loader.env import Env
+
+
+class Variable(NamedTuple):
+    name: str
+    default: Optional[str]
+
+
+class Template(NamedTuple):
+    """A string with ${VAR_NAME} or ${VAR_NAME:default} placeholders split into segments."""
+
+    text: str
+    segments: Tuple[Union[str, Variable], ...]
+
+    @property
+    def variables(self) -> FrozenSet[str]:
+        return frozenset(segment.name for segment in self.segments if isinstance(segment, Variable))
+
+    def render(self, env: Env, default: Any = None) -> Optional[str]:
+        """Renders the template with the same rules as Env.replace_var."""
+        parts = []
+        for segment in self.segments:
+            if not isinstance(segment, Variable):
+                parts.append(segment)
+                continue
+            value = env.get(segment.name)
+            if value is None:
+                value = segment.default if segment.default is not None else default
+            parts.append(str(value) if value is not None else "")
+        result = "".join(parts)
+        return result if result != "" else None
+
+
+@lru_cache(maxsize=4096)
+def compile_template(text: str) -> Optional[Template]:
+    """Compiles a string into a Template, or returns None if it has no placeholders."""
+    if "${" not in text:
+        return None
+    segments: List[Union[str, Variable]] = []
+    position = 0
+    for match in Env.ENV_VAR_PATTERN.finditer(text):
+        if match.start() > position:
+            segments.append(text[position : match.start()])
+        segments.append(Variable(match.group(1), match.group(2)))
+        position = match.end()
+    if not segments:
+        return None
+    if position < len(text):
+        segments.append(text[position:])
+    return Template(text, tuple(segments))
+
+
+# Empty strings are indexed too, so rendering turns them to None like Env.replace_var does
+_EMPTY = Template("", ())
+
+# Template locations of a container: key or index -> template or locations of the child
+_Locations = Dict[Any, Union[Template, "_Locations"]]
+
+
+class TemplateIndex:
+    """Locations of the templated strings of a config tree, found in one scan.
+
+    Rendering visits only containers holding templates and copies only those whose
+    values change, so applying a new environment costs time proportional to the number
+    of templated values. Nodes shared in the tree (e.g. YAML aliases) stay shared.
+
+    A reverse index maps each variable to the paths of the templates using it, so
+    rendering for a few changed variables only visits their dependents.
+    """
+
+    def __init__(self, locations: _Locations) -> None:
+        self.locations = locations
+        self.dependents: Dict[str, List[Tuple[Any, ...]]] = {}
+        _index_dependents(locations, (), self.dependents)
+
+    @classmethod
+    def scan(cls, tree: Any) -> "TemplateIndex":
+        """Indexes the templated strings of the dicts and lists of a raw (unrendered) tree."""
+        if not isinstance(tree, (dict, list)):
+            return cls({})
+        return cls(_scan(tree, {}) or {})
+
+    @property
+    def variables(self) -> Set[str]:
+        """Names of all variables used by the indexed templates."""
+        return set(self.dependents)
+
+    def render(
+        self,
+        tree: Any,
+        env: Env,
+        default: Any = None,
+        variables: Optional[Iterable[str]] = None,
+    ) -> Any:
+        """Returns the tree with the templates rendered through env.
+
+        The tree is the raw tree or a tree previously returned by render(); it is not
+        modified. If variables are given, only templates using them are rendered.
+        """
+        locations = self.locations if variables is None else self._restrict(variables)
+        return _render(tree, locations, env, default, {})
+
+    def _restrict(self, variables: Iterable[str]) -> _Locations:
+        """Returns the locations of the templates using any of the variables."""
+        restricted: _Locations = {}
+        for name in variables:
+            for path in self.dependents.get(name, ()):
+                locations, node = self.locations, restricted
+                for key in path[:-1]:
+                    locations = cast(_Locations, locations[key])
+                    node = cast(_Locations, node.setdefault(key, {}))
+                node[path[-1]] = locations[path[-1]]
+        return restricted
+
+
+def _scan(node: Any, memo: Dict[int, Tuple[Any, Optional[_Locations]]]) -> Optional[_Locations]:
+    if id(node) in memo:
+        return memo[id(node)][1]
+    locations: _Locations = {}
+    for key, value in node.items() if isinstance(node, dict) else enumerate(node):
+        if isinstance(value, str):
+            template = compile_template(value) if value else _EMPTY
+            if template is not None:
+                locations[key] = template
+        elif isinstance(value, (dict, list)):
+            child = _scan(value, memo)
+            if child is not None:
+                locations[key] = child
+    result = locations or None
+    # The node is kept in the memo so its id is not reused during the scan
+    memo[id(node)] = (node, result)
+    return result
+
+
+def _index_dependents(
+    locations: _Locations, path: Tuple[Any, ...], dependents: Dict[str, List[Tuple[Any, ...]]]
+) -> None:
+    for key, location in locations.items():
+        if isinstance(location, Template):
+            for name in location.variables:
+                dependents.setdefault(name, []).append(path + (key,))
+        else:
+            _index_dependents(location, path + (key,), dependents)
+
+
+def _render(
+    node: Any, locations: _Locations, env: Env, default: Any, memo: Dict[int, Tuple[Any, Any]]
+) -> Any:
+    cached = memo.get(id(node))
+    if cached is not None:
+        return cached[1]
+    result = node
+    for key, location in locations.items():
+        child = node[key]
+        if isinstance(location, Template):
+            rendered = location.render(env, default)
+            changed = rendered != child
+        else:
+            rendered = _render(child, location, env, default, memo)
+            changed = rendered is not child
+        if changed:
+            if result is node:
+                result = node.copy()
+            result[key] = rendered
+    memo[id(node)] = (node, result)
+    return result
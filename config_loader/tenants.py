@@ -0,0 +1,97 @@
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional
+
+from config_loader.config import ConfigCollection, LayeredConfigCollection
+from config_loader.exceptions import ConfigError
+from config_loader.frozen import FrozenDict, freeze
+from config_loader.merge import DeepMerger
+
+
+class TenantStore:
+    """Per-tenant configs stored as one shared base plus a small delta per tenant.
+
+    Tenant views resolve lookups through the delta, then the base, so memory grows with
+    the total size of the deltas rather than with the number of tenants. Materialized
+    trees share all subtrees the delta does not touch with the base; the most recently
+    used ones are kept in an LRU cache of cache_size entries.
+    """
+
+    def __init__(
+        self,
+        base: Mapping[str, Any],
+        deltas: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        cache_size: int = 0,
+    ) -> None:
+        self.base = base
+        self.cache_size = cache_size
+        self._deltas: Dict[str, Mapping[str, Any]] = {}
+        self._materialized: "OrderedDict[str, ConfigCollection]" = OrderedDict()
+        for tenant, delta in (deltas or {}).items():
+            self.set_tenant(tenant, delta)
+
+    def __contains__(self, tenant: object) -> bool:
+        return tenant in self._deltas
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._deltas)
+
+    def delta(self, tenant: str) -> Mapping[str, Any]:
+        """Returns the overrides of a tenant.
+
+        Raises:
+            ConfigError: If the tenant is unknown
+        """
+        try:
+            return self._deltas[tenant]
+        except KeyError as e:
+            raise ConfigError(f"Unknown tenant '{tenant}'") from e
+
+    def set_tenant(self, tenant: str, delta: Mapping[str, Any]) -> None:
+        """Adds a tenant or replaces its overrides."""
+        self._deltas[tenant] = freeze(delta) if isinstance(self.base, FrozenDict) else delta
+        self._materialized.pop(tenant, None)
+
+    def remove_tenant(self, tenant: str) -> None:
+        self.delta(tenant)
+        del self._deltas[tenant]
+        self._materialized.pop(tenant, None)
+
+    def set_base(self, base: Mapping[str, Any]) -> None:
+        """Replaces the shared base; materialized tenants are dropped."""
+        self.base = base
+        self._materialized.clear()
+
+    def view(self, tenant: str) -> LayeredConfigCollection:
+        """Returns a collection resolving lookups through the tenant delta, then the base.
+
+        Raises:
+            ConfigError: If the tenant is unknown
+        """
+        return LayeredConfigCollection([self.base, self.delta(tenant)])
+
+    def materialize(self, tenant: str) -> ConfigCollection:
+        """Returns a collection over the merged tree of a tenant, cached in the LRU.
+
+        Raises:
+            ConfigError: If the tenant is unknown
+        """
+        collection = self._materialized.get(tenant)
+        if collection is not None:
+            self._materialized.move_to_end(tenant)
+            return collection
+        configs = DeepMerger().merge(self.base, self.delta(tenant))
+        if isinstance(self.base, FrozenDict):
+            configs = freeze(configs)
+        collection = ConfigCollection(configs)
+        if self.cache_size > 0:
+            self._materialized[tenant] = collection
+            if len(self._materialized) > self.cache_size:
+                self._materialized.popitem(last=False)
+        return collection
+
+    def cached_tenants(self) -> List[str]:
+        """Returns the materialized tenants, least recently used first."""
+        return list(self._materialized)
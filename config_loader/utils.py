@@ -1,21 +1,54 @@
 from pathlib import Path
-from typing import Any, Dict, Union, cast
+from typing import Any, Dict, Optional, Union, cast
 
-from config_loader.env import EnvFactory
+from config_loader.env import EnvFactory, EnvSource
+from config_loader.merge import DeepMerger
 from config_loader.yaml_service import YamlLoaderFactory, YamlReaderService
 
 
 def yaml_load_configs(
-    yaml_dir: Union[str, Path], env_path: Union[Path, str, None] = None
+    yaml_dir: Union[str, Path],
+    env_path: EnvSource = None,
+    fused: bool = False,
+    isolated: bool = False,
 ) -> Dict[str, Dict[str, Any]]:
-    result = EnvFactory.create(env_path).replace_vars(
-        YamlLoaderFactory.create().load_configs(yaml_dir)
-    )
+    """Loads the YAML configs of a directory, keyed by file name.
+
+    With fused, environment variables are substituted while parsing instead of in a
+    second pass over the loaded tree. The .env files are loaded into os.environ unless
+    isolated is set, see Env; an Env given as env_path is used as is.
+    """
+    env = EnvFactory.from_source(env_path, isolated)
+    if fused:
+        return YamlLoaderFactory.create().load_configs(yaml_dir, env)
+    result = env.replace_vars(YamlLoaderFactory.create().load_configs(yaml_dir))
     return cast(Dict[str, Dict[str, Any]], result)
 
 
 def yaml_load_config(
-    yaml_file: Union[str, Path], env_path: Union[Path, str, None] = None
+    yaml_file: Union[str, Path],
+    env_path: EnvSource = None,
+    fused: bool = False,
+    isolated: bool = False,
+) -> Dict[str, Any]:
+    """Loads a YAML config; see yaml_load_configs() for the options."""
+    env = EnvFactory.from_source(env_path, isolated)
+    if fused:
+        return YamlReaderService.load(yaml_file, env=env)
+    result = env.replace_vars(YamlReaderService.load(yaml_file))
+    return cast(Dict[str, Any], result)
+
+
+def yaml_load_merged_configs(
+    yaml_dir: Union[str, Path],
+    env_path: EnvSource = None,
+    merger: Optional[DeepMerger] = None,
+    fused: bool = False,
+    isolated: bool = False,
 ) -> Dict[str, Any]:
-    result = EnvFactory.create(env_path).replace_vars(YamlReaderService.load(yaml_file))
+    """Loads the YAML configs of a directory folded into one tree; see yaml_load_configs()."""
+    env = EnvFactory.from_source(env_path, isolated)
+    if fused:
+        return YamlLoaderFactory.create().load_merged(yaml_dir, merger, env)
+    result = env.replace_vars(YamlLoaderFactory.create().load_merged(yaml_dir, merger))
     return cast(Dict[str, Any], result)
@@ -1,21 +1,70 @@
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Type, Union, cast
 
 import yaml
 
+from config_loader.compact import pack_numeric_arrays
+from config_loader.env import Env
+from config_loader.merge import DeepMerger
+
 
 class YamlConfigLoaderError(Exception):
     def __init__(self, error: Exception) -> None:
         super().__init__(f"Yaml configuration error: {error}")
 
 
+class EnvSafeLoader(yaml.SafeLoader):  # pylint: disable=too-many-ancestors
+    """SafeLoader substituting environment variables in string values while parsing.
+
+    Values are resolved with Env.replace_var as their mapping or list is constructed, so
+    no second pass over the tree is needed. The result matches Env.replace_vars: keys,
+    including aliased strings reused as keys, and values of other collections (!!omap,
+    !!pairs, !!set) are left as is.
+    """
+
+    env: Env
+
+    @classmethod
+    def bind(cls, env: Env) -> Type["EnvSafeLoader"]:
+        """Returns a loader class resolving variables through env."""
+        return cast(Type[EnvSafeLoader], type(cls.__name__, (cls,), {"env": env}))
+
+    def construct_document(self, node: yaml.Node) -> Any:
+        data = super().construct_document(node)
+        return self.env.replace_var(data) if isinstance(data, str) else data
+
+    def construct_mapping(self, node: yaml.MappingNode, deep: bool = False) -> Dict[Any, Any]:
+        mapping = cast(Dict[Any, Any], super().construct_mapping(node, deep))
+        for key, value in mapping.items():
+            if isinstance(value, str):
+                mapping[key] = self.env.replace_var(value)
+        return mapping
+
+    def construct_sequence(self, node: yaml.SequenceNode, deep: bool = False) -> List[Any]:
+        return [
+            self.env.replace_var(item) if isinstance(item, str) else item
+            for item in super().construct_sequence(node, deep)
+        ]
+
+
 class YamlReaderService:
     """Loads config from YAML and substitutes environment variables."""
 
     @staticmethod
-    def load(config_path: Union[str, Path]) -> Dict[str, Any]:
+    def load(
+        config_path: Union[str, Path],
+        numeric_array_threshold: Optional[int] = None,
+        use_numpy: bool = False,
+        env: Optional[Env] = None,
+    ) -> Dict[str, Any]:
+        """Loads a YAML file; homogeneous int/float lists with at least numeric_array_threshold
+        items are stored as compact arrays (NumPy arrays if use_numpy and NumPy is installed).
+
+        If env is given, environment variables in string values are substituted while
+        parsing, see EnvSafeLoader.
+        """
         if isinstance(config_path, str):
             config_path = Path(config_path)
 
@@ -24,10 +73,17 @@ class YamlReaderService:
                 return {}
 
             with open(config_path, "r", encoding="utf-8") as f:
-                return yaml.safe_load(f) or {}
+                if env is None:
+                    configs = yaml.safe_load(f) or {}
+                else:
+                    configs = yaml.load(f, Loader=EnvSafeLoader.bind(env)) or {}
         except (FileNotFoundError, yaml.YAMLError, PermissionError, OSError) as e:
             raise YamlConfigLoaderError(e) from e
 
+        if numeric_array_threshold is not None:
+            configs = pack_numeric_arrays(configs, numeric_array_threshold, use_numpy)
+        return configs
+
 
 class YamlLoaderService:
     """Loads all YAML configs from the specified directory."""
@@ -35,29 +91,52 @@ class YamlLoaderService:
     def __init__(self, yaml_service: YamlReaderService) -> None:
         self.yaml_service = yaml_service
 
-    def load_configs(self, config_dir: Union[str, Path]) -> Dict[str, Dict[str, Any]]:
+    def load_configs(
+        self, config_dir: Union[str, Path], env: Optional[Env] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        return dict(self._iter_configs(config_dir, env))
+
+    def load_merged(
+        self,
+        config_dir: Union[str, Path],
+        merger: Optional[DeepMerger] = None,
+        env: Optional[Env] = None,
+    ) -> Dict[str, Any]:
+        """Folds all YAML configs of the directory into one tree in a single pass.
+
+        Files are merged in file name order, later files taking priority.
+        """
+        merger = merger or DeepMerger()
+        return cast(
+            Dict[str, Any],
+            merger.merge_all(config for _, config in self._iter_configs(config_dir, env)),
+        )
+
+    def _iter_configs(
+        self, config_dir: Union[str, Path], env: Optional[Env]
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
         if isinstance(config_dir, str):
             config_dir = Path(config_dir)
 
         if not config_dir.is_dir():
-            return {}
+            return
 
-        configs: Dict[str, Dict[str, Any]] = {}
         try:
-            for file_name in os.listdir(config_dir):
-                if not re.match(r".*\.ya?ml$", file_name):
-                    continue
-                try:
-                    file_path = os.path.join(config_dir, file_name)
-                    config_name = re.sub(r"\.ya?ml$", "", file_name)  # Remove .yaml or .yml
-                    configs[config_name] = self.yaml_service.load(file_path)
-                except YamlConfigLoaderError:
-                    # Skip files that cannot be loaded
-                    continue
+            file_names = sorted(os.listdir(config_dir))
         except OSError as e:
             raise YamlConfigLoaderError(e) from e
 
-        return configs
+        for file_name in file_names:
+            if not re.match(r".*\.ya?ml$", file_name):
+                continue
+            try:
+                file_path = os.path.join(config_dir, file_name)
+                config_name = re.sub(r"\.ya?ml$", "", file_name)  # Remove .yaml or .yml
+                config = self.yaml_service.load(file_path, env=env)
+            except YamlConfigLoaderError:
+                # Skip files that cannot be loaded
+                continue
+            yield config_name, config
 
 
 class YamlLoaderFactory:
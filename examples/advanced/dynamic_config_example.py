@@ -19,10 +19,11 @@ class DynamicConfigManager:
         self.env = self.env_factory.create()
 
     def update_config(self, new_values: Dict[str, Any]) -> None:
-        """Updates configuration with new values."""
-        current_config = self.config.all()
-        current_config.update(new_values)
-        self.config = self.config_factory.create(current_config)
+        """Updates configuration with new values.
+
+        with_updates copies only the changed paths, so earlier versions stay intact.
+        """
+        self.config = self.config.with_updates(new_values)
 
     def add_environment_variables(self) -> None:
         """Adds environment variables to configuration."""
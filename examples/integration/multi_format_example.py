@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict
 
 from config_loader.config import ConfigFactory
+from config_loader.merge import DeepMerger
 from config_loader.yaml_service import YamlLoaderFactory
 
 
@@ -40,11 +41,8 @@ class MultiFormatConfigLoader:
         return result
 
     def merge_configs(self, configs: list[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merges multiple configurations."""
-        result = {}
-        for config in configs:
-            result.update(config)
-        return result
+        """Deep-merges multiple configurations, later ones taking priority."""
+        return DeepMerger().merge_all(configs)
 
 
 def main():
@@ -0,0 +1,143 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from config_loader.binding import bind, converter_for
+from config_loader.exceptions import ValidationError
+
+
+@dataclass
+class Credentials:
+    username: str
+    password: str
+
+
+@dataclass
+class DatabaseSettings:
+    host: str
+    port: int
+    credentials: Credentials
+    replicas: List[str] = field(default_factory=list)
+    options: Dict[str, int] = field(default_factory=dict)
+    timeout: Optional[float] = None
+    debug: bool = False
+
+
+@dataclass
+class Node:
+    name: str
+    children: List["Node"] = field(default_factory=list)
+
+
+@pytest.fixture
+def database_data():
+    return {
+        "host": "localhost",
+        "port": "5432",
+        "credentials": {"username": "user", "password": "pass"},
+        "replicas": ["r1", "r2"],
+        "options": {"pool": "10"},
+        "debug": "true",
+        "unknown": "ignored",
+    }
+
+
+def test_bind_dataclass(database_data):
+    settings = bind(database_data, DatabaseSettings)
+    assert settings == DatabaseSettings(
+        host="localhost",
+        port=5432,
+        credentials=Credentials("user", "pass"),
+        replicas=["r1", "r2"],
+        options={"pool": 10},
+        timeout=None,
+        debug=True,
+    )
+
+
+def test_bind_optional_value(database_data):
+    database_data["timeout"] = 1.5
+    assert bind(database_data, DatabaseSettings).timeout == 1.5
+    database_data["timeout"] = None
+    assert bind(database_data, DatabaseSettings).timeout is None
+
+
+def test_bind_list_of_dataclasses():
+    records = [{"username": f"user{i}", "password": "secret"} for i in range(3)]
+    bound = bind(records, List[Credentials])
+    assert [item.username for item in bound] == ["user0", "user1", "user2"]
+    assert bind(["1", "2"], Tuple[int, ...]) == (1, 2)
+
+
+def test_bind_recursive_dataclass():
+    tree = bind({"name": "root", "children": [{"name": "leaf"}]}, Node)
+    assert tree.children[0] == Node("leaf")
+
+
+def test_bind_converter_is_cached():
+    assert converter_for(DatabaseSettings) is converter_for(DatabaseSettings)
+    assert converter_for(List[Credentials]) is converter_for(List[Credentials])
+
+
+def test_bind_missing_required_field(database_data):
+    del database_data["credentials"]["password"]
+    with pytest.raises(ValidationError, match="credentials.password"):
+        bind(database_data, DatabaseSettings)
+
+
+def test_bind_invalid_values(database_data):
+    database_data["port"] = "not-a-number"
+    with pytest.raises(ValidationError, match="port"):
+        bind(database_data, DatabaseSettings)
+
+    with pytest.raises(ValidationError):
+        bind({"host": "h", "port": 1, "credentials": "nope"}, DatabaseSettings)
+
+    with pytest.raises(ValidationError):
+        bind({"name": "n", "children": "nope"}, Node)
+
+
+@pytest.mark.parametrize(
+    "value, target",
+    [(None, str), ({"a": 1}, str), (3.9, int), (True, int), ("x", float), (True, str)],
+)
+def test_bind_rejects_lossy_coercion(value, target):
+    with pytest.raises(ValidationError):
+        bind(value, target)
+
+
+def test_bind_coerces_strings_and_ints():
+    assert bind("3", int) == 3
+    assert bind("1.5", float) == 1.5
+    assert bind(2, float) == 2.0 and isinstance(bind(2, float), float)
+    assert bind("off", bool) is False
+    assert bind({"username": "user", "password": 12345}, Credentials).password == "12345"
+    assert bind(1.5, str) == "1.5"
+
+
+def test_bind_fixed_length_tuple():
+    assert bind(["1", 2], Tuple[int, str]) == (1, "2")
+    with pytest.raises(ValidationError, match="expected 2 items"):
+        bind([1], Tuple[int, str])
+    with pytest.raises(ValidationError, match="1"):
+        bind([1, None], Tuple[int, str])
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="X | Y unions need Python 3.10")
+def test_bind_pep604_union():
+    target = int | None
+    assert bind("5", target) == 5
+    assert bind(None, target) is None
+    assert bind("x", str | int) == "x"
+
+
+def test_bind_unresolvable_hint_is_not_cached():
+    @dataclass
+    class Broken:
+        value: "Missing"  # noqa: F821
+
+    for _ in range(2):
+        with pytest.raises(NameError):
+            converter_for(Broken)
@@ -0,0 +1,125 @@
+import sys
+from array import array
+
+from config_loader.compact import (
+    Compactor,
+    compact_tree,
+    deep_sizeof,
+    pack_numeric_arrays,
+    pack_record_tables,
+)
+from config_loader.frozen import FrozenArray, FrozenDict, freeze
+from config_loader.records import RecordTable
+
+
+def _fleet(count):
+    return {
+        f"host{i}": {
+            "tls": {"cert": "/etc/tls/cert.pem", "key": "/etc/tls/key.pem", "verify": True},
+            "retry": {"attempts": 3, "backoff": 0.5},
+            "port": 8080,
+        }
+        for i in range(count)
+    }
+
+
+def test_compact_tree_interns_strings():
+    long_value = "x" * 100
+    data = {"".join(["ho", "st"]): "".join(["local", "host"]), "long": long_value}
+    result, _ = compact_tree(data)
+    key = next(iter(result))
+    assert key is sys.intern("host")
+    assert result["host"] is sys.intern("localhost")
+    assert result["long"] is long_value
+    assert result == data
+
+
+def test_compact_tree_shares_frozen_subtrees():
+    result, report = compact_tree(freeze(_fleet(100)))
+    assert result == freeze(_fleet(100))
+    assert isinstance(result, FrozenDict)
+    assert result["host0"] is result["host1"]
+    assert report.bytes_saved > 0
+    assert report.bytes_after == deep_sizeof(result)
+
+
+def test_compact_tree_keeps_mutable_subtrees_separate():
+    result, _ = compact_tree(_fleet(2))
+    assert result == _fleet(2)
+    assert result["host0"] is not result["host1"]
+    result["host0"]["port"] = 1
+    assert result["host1"]["port"] == 8080
+
+
+def test_compact_tree_distinguishes_equal_scalars_of_other_types():
+    result, _ = compact_tree(freeze({"a": {"v": 1}, "b": {"v": True}, "c": {"v": 1.0}}))
+    assert result["a"]["v"] is not True
+    assert result["b"]["v"] is True
+    assert isinstance(result["c"]["v"], float)
+
+
+def test_compactor_preserves_aliases():
+    shared = {"key": "value"}
+    result = Compactor().compact({"a": shared, "b": shared})
+    assert result["a"] is result["b"]
+
+
+def test_pack_numeric_arrays():
+    data = {
+        "weights": [0.5] * 10,
+        "tiers": list(range(10)),
+        "short": [1, 2],
+        "mixed": [1, 2.5] * 5,
+        "flags": [True] * 10,
+        "nested": [{"buckets": list(range(10))}],
+    }
+    result = pack_numeric_arrays(data, threshold=10)
+    assert result["weights"] == array("d", [0.5] * 10)
+    assert result["tiers"] == array("q", range(10))
+    assert result["short"] is data["short"]
+    assert result["mixed"] is data["mixed"]
+    assert result["flags"] is data["flags"]
+    assert result["nested"][0]["buckets"] == array("q", range(10))
+
+
+def test_pack_numeric_arrays_keeps_unchanged_tree():
+    data = {"values": [1, 2, 3], "name": "test"}
+    assert pack_numeric_arrays(data, threshold=10) is data
+
+
+def test_pack_numeric_arrays_int_overflow():
+    data = [2**70] * 3
+    assert pack_numeric_arrays(data, threshold=1) is data
+
+
+def test_pack_numeric_arrays_frozen():
+    data = freeze({"values": [1, 2, 3]})
+    result = pack_numeric_arrays(data, threshold=3)
+    assert isinstance(result, FrozenDict)
+    assert result["values"] == array("q", [1, 2, 3])
+
+
+def test_pack_record_tables():
+    routes = [{"path": f"/r{i}", "port": i} for i in range(3)]
+    data = {"routes": routes, "mixed": [{"a": 1}, {"b": 2}, {"a": 3}], "short": routes[:2]}
+    result = pack_record_tables(data, threshold=3)
+    assert isinstance(result["routes"], RecordTable)
+    assert result["routes"] == routes
+    assert result["mixed"] is data["mixed"]
+    assert result["short"] is data["short"]
+    assert pack_record_tables({"short": routes[:2]}, threshold=3) == {"short": routes[:2]}
+
+
+def test_pack_record_tables_frozen():
+    routes = [{"path": f"/r{i}", "tags": ["a"]} for i in range(3)]
+    result = freeze(pack_record_tables({"routes": routes}, threshold=3))
+    assert isinstance(result["routes"], RecordTable)
+    assert result["routes"][0]["tags"] == ("a",)
+    assert hash(result)
+
+
+def test_deep_sizeof_counts_frozen_storage():
+    records = [{f"key{j}": j for j in range(50)} for _ in range(20)]
+    assert deep_sizeof(freeze(records)) >= deep_sizeof(records)
+    values = array("d", range(1000))
+    assert deep_sizeof(FrozenArray(values)) > sys.getsizeof(values)
@@ -1,7 +1,25 @@
+import os
+from array import array
+from dataclasses import dataclass
+
 import pytest
 import yaml
 
-from config_loader.config import ConfigCollection, ConfigFactory
+from config_loader.config import (
+    ConfigCollection,
+    ConfigFactory,
+    ConfigSection,
+    LayeredConfigCollection,
+    LazyConfigCollection,
+    StorageOptions,
+)
+from config_loader.diff import ChangeKind, ConfigChange
+from config_loader.env import Env
+from config_loader.exceptions import ConfigError, ValidationError
+from config_loader.frozen import freeze
+from config_loader.merge import DeepMerger
+from config_loader.overrides import EnvOverrides
+from config_loader.records import RecordTable
 
 
 @pytest.fixture
@@ -143,3 +161,412 @@ def test_config_factory_create_by_path_directory(temp_yaml_dir, monkeypatch):
     assert configs["config1"]["value"] == "val1"
     assert configs["config2"]["name"] == "config2"
     assert configs["config2"]["value"] == "val2"
+
+
+def test_config_factory_create_frozen(sample_configs):
+    config = ConfigFactory.create(sample_configs, StorageOptions(frozen=True))
+    assert config.frozen
+    assert config.all() == freeze(sample_configs)
+    assert config.get("database.credentials.username") == "user"
+    assert config.get("array_section.1.name") == "second"
+    assert config.get("app.features.1") == "feature2"
+
+    with pytest.raises(TypeError):
+        config.all()["database"] = {}
+
+
+def test_config_factory_create_not_frozen(sample_configs):
+    assert not ConfigFactory.create(sample_configs).frozen
+
+
+def test_config_factory_create_by_path_frozen(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "test_host")
+    config = ConfigFactory.create_by_path(temp_yaml_file, storage=StorageOptions(frozen=True))
+    assert config.frozen
+    assert config.get("database.host") == "test_host"
+    assert hash(config.all()) == hash(config.all())
+
+
+def test_config_collection_as_object(config_collection):
+    cfg = config_collection.as_object()
+    assert cfg.database.credentials.username == "user"
+    assert cfg.app.features == ("feature1", "feature2")
+    assert cfg.array_section[1].name == "second"
+    assert cfg.app.limits == {"5": "five", "10": "ten"}
+
+
+def test_config_collection_bind(config_collection):
+    @dataclass
+    class Credentials:
+        username: str
+        password: str
+
+    credentials = config_collection.bind("database.credentials", Credentials)
+    assert credentials == Credentials("user", "pass")
+
+    with pytest.raises(ValidationError):
+        config_collection.bind("nonexistent", Credentials)
+
+
+def test_config_collection_section(config_collection):
+    database = config_collection.section("database")
+    assert database.get("host") == "localhost"
+    assert database.get("credentials.username") == "user"
+    assert database.get("nonexistent", "default") == "default"
+    assert database.all() is config_collection.get("database")
+
+    credentials = database.section("credentials")
+    assert credentials.prefix == "database.credentials"
+    assert credentials.root is config_collection
+    assert credentials.get("password") == "pass"
+
+
+def test_config_collection_empty_section(config_collection):
+    root = config_collection.section("")
+    assert root.all() is config_collection.all()
+    assert root.get("database.host") == config_collection.get("database.host")
+    assert root.section("database").get("port") == config_collection.get("database.port")
+
+
+def test_config_collection_section_follows_reload(config_collection):
+    database = config_collection.section("database")
+    config_collection.reload({"database": {"host": "remote"}})
+    assert database.get("host") == "remote"
+    assert database.get("port") is None
+
+    config_collection.reload({})
+    assert database.all() == {}
+
+
+def test_config_section_delegates_to_root(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    config = ConfigFactory.create_templated(temp_yaml_file)
+    database = config.section("database")
+    assert database.templates is config.templates
+    assert database.compaction is config.compaction
+    assert not database.frozen
+
+    env = Env()
+    changes = database.apply_env(env, env.update({"DB_HOST": "rotated"}))
+    assert [change.path for change in changes] == ["database.host"]
+    assert database.get("host") == "rotated"
+
+    updated = database.set("port", 6543)
+    assert isinstance(updated, ConfigSection)
+    assert updated.get("port") == 6543
+    assert updated.root.get("database.host") == "rotated"
+    assert database.get("port") == 5432
+
+
+def test_config_collection_reload_without_loader(config_collection):
+    with pytest.raises(ConfigError):
+        config_collection.reload()
+
+
+def test_config_factory_create_by_path_reload(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "test_host")
+    config = ConfigFactory.create_by_path(temp_yaml_file)
+    database = config.section("database")
+
+    monkeypatch.setenv("DB_HOST", "new_host")
+    database.reload()
+    assert config.get("database.host") == "new_host"
+    assert database.get("host") == "new_host"
+
+
+def test_config_collection_get_by_field(config_collection):
+    assert config_collection.get("array_section[name=second].id") == 2
+    assert config_collection.get("array_section[id=1].name") == "first"
+    assert config_collection.get("array_section[name=missing].id", "default") == "default"
+    assert config_collection.get("app.name[name=first]") is None
+    assert config_collection.section("array_section").get("[id=2].name") == "second"
+
+
+def test_config_collection_get_by_field_first_match_wins():
+    config = ConfigCollection({"items": [{"k": "a", "v": 1}, {"k": "a", "v": 2}, "scalar"]})
+    assert config.get("items[k=a].v") == 1
+
+
+def test_config_collection_field_index_dropped_on_reload(config_collection):
+    assert config_collection.get("array_section[name=first].id") == 1
+    config_collection.reload({"array_section": [{"id": 3, "name": "first"}]})
+    assert config_collection.get("array_section[name=first].id") == 3
+
+
+def test_config_collection_get_by_field_sees_in_place_changes(config_collection):
+    assert config_collection.get("array_section[name=third].id") is None
+    config_collection.all()["array_section"].append({"id": 3, "name": "third"})
+    assert config_collection.get("array_section[name=third].id") == 3
+
+    frozen = ConfigFactory.create({"items": [{"k": "a"}, {"k": "b"}]}, StorageOptions(frozen=True))
+    assert frozen.get("items[k=b]") == {"k": "b"}
+    assert frozen.get("items[k=b]") is frozen.get("items.1")
+
+
+def test_config_factory_create_compact(sample_configs):
+    config = ConfigFactory.create(sample_configs, StorageOptions(frozen=True, compact=True))
+    assert config.all() == freeze(sample_configs)
+    assert config.compaction is not None
+    assert ConfigFactory.create(sample_configs).compaction is None
+
+
+def test_config_factory_create_by_path_compact(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "test_host")
+    config = ConfigFactory.create_by_path(temp_yaml_file, storage=StorageOptions(compact=True))
+    assert config.get("database.host") == "test_host"
+    first_report = config.compaction
+    config.reload()
+    assert config.compaction is not None
+    assert config.compaction is not first_report
+
+
+def test_config_factory_create_numeric_arrays():
+    configs = {"tables": {"weights": [float(i) for i in range(2000)], "tiers": list(range(2000))}}
+    config = ConfigFactory.create(configs, StorageOptions(numeric_array_threshold=1000))
+    assert isinstance(config.get("tables.tiers"), array)
+    assert config.get("tables.weights.1234") == 1234.0
+    assert config.get("tables.tiers.1999") == 1999
+    assert config.get("tables.tiers.2000") is None
+
+    frozen = ConfigFactory.create(
+        configs, StorageOptions(frozen=True, numeric_array_threshold=1000)
+    )
+    assert frozen.get("tables.tiers.1234") == 1234
+    assert hash(frozen.all())
+
+
+def test_config_factory_create_record_tables():
+    routes = [{"name": f"route{i}", "path": f"/r{i}"} for i in range(200)]
+    config = ConfigFactory.create({"routes": routes}, StorageOptions(record_table_threshold=100))
+    assert isinstance(config.get("routes"), RecordTable)
+    assert config.get("routes.123.path") == "/r123"
+    assert config.get("routes.123.missing") is None
+    assert config.get("routes[name=route7].path") == "/r7"
+    assert [route["name"] for route in config.get("routes")][:2] == ["route0", "route1"]
+    assert config.as_object().routes[5].path == "/r5"
+
+
+def test_config_collection_set(config_collection, sample_configs):
+    updated = config_collection.set("database.host", "remote")
+    assert updated.get("database.host") == "remote"
+    assert config_collection.get("database.host") == "localhost"
+    assert updated.get("app") is config_collection.get("app")
+
+
+def test_config_collection_with_updates(config_collection):
+    updated = config_collection.with_updates(
+        {"database.port": 6543, "app.features.0": "changed", "array_section[id=2].name": "2nd"}
+    )
+    assert updated.get("database.port") == 6543
+    assert updated.get("app.features") == ["changed", "feature2"]
+    assert updated.get("array_section.1.name") == "2nd"
+    assert config_collection.get("app.features.0") == "feature1"
+    assert updated.get("database.credentials") is config_collection.get("database.credentials")
+
+
+def test_config_collection_with_updates_frozen(sample_configs):
+    config = ConfigFactory.create(sample_configs, StorageOptions(frozen=True))
+    updated = config.with_updates({"database.extra": {"key": ["value"]}})
+    assert updated.frozen
+    assert updated.get("database.extra.key") == ("value",)
+    assert config.get("database.extra") is None
+
+
+def test_config_factory_create_layered(sample_configs):
+    config = ConfigFactory.create_layered(
+        [sample_configs, {"database": {"host": "remote"}}, {"app": {"debug": False}}]
+    )
+    assert isinstance(config, LayeredConfigCollection)
+    assert config.get("database.host") == "remote"
+    assert config.get("database.port") == 5432
+    assert config.get("app.debug") is False
+    assert config.get("app.name") == "test_app"
+    assert config.get("array_section[id=2].name") == "second"
+    assert config.all()["database"]["credentials"] == {"username": "user", "password": "pass"}
+    assert config.section("database").get("host") == "remote"
+
+    config.set_layer(1, {})
+    assert config.get("database.host") == "localhost"
+
+    config.reload({"app": {"name": "reloaded"}})
+    assert config.get("app.name") == "reloaded"
+    assert config.get("app.debug") is True
+    assert len(config.layers) == 3
+
+
+def test_config_factory_create_by_path_merged(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    (tmp_path / "a.yaml").write_text("db:\n  host: localhost\n  port: 5432\n")
+    (tmp_path / "b.yaml").write_text("db:\n  host: ${DB_HOST}\n")
+    config = ConfigFactory.create_by_path(tmp_path, merger=DeepMerger())
+    assert config.get("db") == {"host": "prod-db", "port": 5432}
+
+
+def test_config_collection_fingerprint(config_collection, sample_configs):
+    fingerprint = config_collection.fingerprint("database")
+    assert fingerprint == ConfigCollection(dict(sample_configs)).fingerprint("database")
+    assert config_collection.section("database").fingerprint() == fingerprint
+    assert config_collection.fingerprint() != fingerprint
+    with pytest.raises(ConfigError):
+        config_collection.fingerprint("missing")
+
+
+def test_config_collection_fingerprint_after_update(config_collection):
+    updated = config_collection.set("database.port", 6432)
+    assert updated.fingerprint("database") != config_collection.fingerprint("database")
+    assert updated.fingerprint("app") == config_collection.fingerprint("app")
+    assert not updated.content_equals(config_collection)
+    assert updated.set("database.port", 5432).content_equals(config_collection)
+
+
+def test_config_collection_fingerprint_after_reload(config_collection, sample_configs):
+    before = config_collection.fingerprint()
+    config_collection.reload({**sample_configs, "debug": True})
+    assert config_collection.fingerprint() != before
+
+
+def test_config_collection_diff(config_collection):
+    updated = config_collection.with_updates({"database.port": 6432, "app.features": ["feature1"]})
+    assert config_collection.diff(updated) == [
+        ConfigChange("database.port", ChangeKind.CHANGED, 5432, 6432),
+        ConfigChange("app.features.1", ChangeKind.REMOVED, old="feature2"),
+    ]
+    assert updated.diff(updated) == []
+
+
+def test_config_collection_subscribe(config_collection, sample_configs):
+    received = []
+    config_collection.subscribe("database.*", received.append)
+    config_collection.section("app").subscribe("name", received.append)
+    config_collection.subscribe("empty_section", received.append)
+
+    updated = config_collection.set("database.port", 6432).set("app.debug", False)
+    config_collection.reload(updated.all())
+    assert received == [[ConfigChange("database.port", ChangeKind.CHANGED, 5432, 6432)]]
+
+    received.clear()
+    config_collection.reload(updated.all())
+    assert received == []
+
+
+def test_config_factory_create_templated(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    config = ConfigFactory.create_templated(temp_yaml_file)
+    assert config.get("database") == {"host": "localhost", "port": 5432}
+
+    received = []
+    config.subscribe("database.host", received.append)
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    config.apply_env(Env())
+    assert config.get("database.host") == "prod-db"
+    assert [change.path for change in received[0]] == ["database.host"]
+
+    config.reload()
+    assert config.get("database.host") == "prod-db"
+    with pytest.raises(ConfigError):
+        ConfigCollection({}).apply_env(Env())
+
+    config.reload({"other": "${DB_HOST}"})
+    assert config.templates is None
+    with pytest.raises(ConfigError):
+        config.apply_env(Env())
+    config.reload()
+    assert config.apply_env(Env()) == []
+
+
+def test_lazy_config_collection(monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    env = Env()
+    raw = {"database": {"host": "${DB_HOST}", "port": 5432}, "unused": {"key": "${MISSING}"}}
+    config = LazyConfigCollection(raw, env)
+    calls = []
+    original = env.replace_vars
+    monkeypatch.setattr(env, "replace_vars", lambda data: calls.append(data) or original(data))
+
+    assert config.get("database.host") == "localhost"
+    assert config.get("database.host") == "localhost"
+    assert config.get("missing", "default") == "default"
+    assert calls == ["${DB_HOST}"]
+    assert config.configs is raw
+    assert config.all() == {
+        "database": {"host": "localhost", "port": 5432},
+        "unused": {"key": None},
+    }
+
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    env.refresh()
+    assert config.get("database.host") == "prod-db"
+    config.reload({"database": {"host": "static"}})
+    assert config.get("database.host") == "static"
+
+
+def test_config_factory_create_lazy(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    config = ConfigFactory.create_lazy(temp_yaml_file)
+    assert config.configs["database"]["host"] == "${DB_HOST}"
+    assert config.get("database") == {"host": "localhost", "port": 5432}
+
+    monkeypatch.setenv("DB_HOST", "remote")
+    config.reload()
+    assert config.get("database.host") == "remote"
+
+
+def test_config_factory_resolves_references(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("db:\n  host: ${DB_HOST}\nurl: http://${config:db.host}/\n")
+    config = ConfigFactory.create_by_path(config_file)
+    assert config.get("url") == "http://localhost/"
+
+    config_file.write_text("db:\n  host: remote\nurl: http://${config:db.host}/\n")
+    config.reload()
+    assert config.get("url") == "http://remote/"
+    configs = {"a": 1, "b": "${config:a}", "c": "${config:missing}"}
+    assert ConfigFactory.create(configs).get("c") == "${config:missing}"
+    with pytest.raises(ConfigError):
+        ConfigFactory.create(configs, references=True)
+    del configs["c"]
+    assert ConfigFactory.create(configs, references=True).get("b") == 1
+
+
+def test_config_collection_apply_env_variables(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    config = ConfigFactory.create_templated(temp_yaml_file)
+    env = Env()
+    changes = config.apply_env(env, env.update({"DB_HOST": "rotated"}))
+    assert changes == [ConfigChange("database.host", ChangeKind.CHANGED, "localhost", "rotated")]
+    assert config.apply_env(env, ["UNUSED"]) == []
+
+
+def test_config_factory_create_by_path_env_overrides(temp_yaml_file, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "localhost")
+    monkeypatch.setenv("APP__DATABASE__PORT", "6432")
+    monkeypatch.setenv("APP__DATABASE__SSL", "true")
+    config = ConfigFactory.create_by_path(temp_yaml_file, overrides=EnvOverrides("APP"))
+    assert config.get("database") == {"host": "localhost", "port": 6432, "ssl": True}
+
+
+def test_config_factory_create_by_path_with_env(temp_yaml_file, tmp_path, monkeypatch):
+    monkeypatch.delenv("DB_HOST", raising=False)
+    env_file = tmp_path / "isolated.env"
+    env_file.write_text("DB_HOST=from-file\n")
+    env = Env(env_file, isolated=True)
+    config = ConfigFactory.create_by_path(temp_yaml_file, env)
+    assert config.get("database.host") == "from-file"
+    assert "DB_HOST" not in os.environ
+
+    monkeypatch.setenv("DB_HOST", "from-process")
+    config.reload()
+    assert config.get("database.host") == "from-process"
+    assert env.version == 1
+
+
+def test_config_factory_loaders_read_secrets_dir(temp_yaml_file, tmp_path, monkeypatch):
+    monkeypatch.delenv("DB_HOST", raising=False)
+    secrets = tmp_path / "secrets"
+    secrets.mkdir()
+    (secrets / "DB_HOST").write_text("secret-db\n")
+    env = Env(isolated=True, secrets_dir=secrets)
+    assert ConfigFactory.create_by_path(temp_yaml_file, env).get("database.host") == "secret-db"
+    assert ConfigFactory.create_templated(temp_yaml_file, env).get("database.host") == "secret-db"
+    assert ConfigFactory.create_lazy(temp_yaml_file, env).get("database.host") == "secret-db"
@@ -0,0 +1,65 @@
+from config_loader.diff import ChangeKind, ConfigChange, TreeDiffer, diff_trees
+from config_loader.fingerprint import Fingerprinter
+from config_loader.frozen import freeze
+
+
+def test_diff_trees_mappings():
+    old = {"database": {"host": "localhost", "port": 5432}, "debug": False}
+    new = {"database": {"host": "prod-db", "user": "app"}, "debug": False}
+    assert diff_trees(old, new) == [
+        ConfigChange("database.host", ChangeKind.CHANGED, "localhost", "prod-db"),
+        ConfigChange("database.port", ChangeKind.REMOVED, old=5432),
+        ConfigChange("database.user", ChangeKind.ADDED, new="app"),
+    ]
+
+
+def test_diff_trees_nested_lists():
+    old = {"servers": [{"name": "api", "port": 80}, {"name": "web"}]}
+    new = {"servers": [{"name": "api", "port": 81}]}
+    assert diff_trees(old, new) == [
+        ConfigChange("servers.0.port", ChangeKind.CHANGED, 80, 81),
+        ConfigChange("servers.1", ChangeKind.REMOVED, old={"name": "web"}),
+    ]
+
+
+def test_diff_trees_type_changes():
+    assert diff_trees({"a": 1}, {"a": 1.0}) == [ConfigChange("a", ChangeKind.CHANGED, 1, 1.0)]
+    assert diff_trees({"a": {"b": 1}}, {"a": [1]}) == [
+        ConfigChange("a", ChangeKind.CHANGED, {"b": 1}, [1])
+    ]
+
+
+def test_diff_trees_identical():
+    tree = {"a": {"b": [1, 2]}}
+    assert diff_trees(tree, tree) == []
+    assert diff_trees(tree, {"a": {"b": [1, 2]}}) == []
+
+
+def test_tree_differ_prunes_by_fingerprint():
+    old = freeze({"big": {str(i): i for i in range(100)}, "flag": False})
+    new = freeze({"big": dict(old["big"]), "flag": True})
+    old_hashes, new_hashes = Fingerprinter(), Fingerprinter()
+    old_hashes.digest(old)
+    new_hashes.digest(new)
+
+    visited = []
+    differ = TreeDiffer(old_hashes, new_hashes)
+    original = differ._diff_mappings
+
+    def diff_mappings(old, new, path, changes):
+        visited.append(path)
+        original(old, new, path, changes)
+
+    differ._diff_mappings = diff_mappings
+    assert differ.diff(old, new) == [ConfigChange("flag", ChangeKind.CHANGED, False, True)]
+    assert visited == [""]
+
+
+def test_tree_differ_does_not_hash_mutable_trees(monkeypatch):
+    old = {"big": {str(i): i for i in range(100)}, "flag": False}
+    new = {"big": dict(old["big"]), "flag": True}
+    hashed = []
+    monkeypatch.setattr(Fingerprinter, "digest", lambda self, node: hashed.append(node))
+    differ = TreeDiffer(Fingerprinter(), Fingerprinter())
+    assert differ.diff(old, new) == [ConfigChange("flag", ChangeKind.CHANGED, False, True)]
+    assert hashed == []
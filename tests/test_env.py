@@ -1,8 +1,10 @@
+import os
 from pathlib import Path
 
 import pytest
 
-from config_loader.env import Env, EnvFactory
+from config_loader import env as env_module
+from config_loader.env import Env, EnvFactory, read_dotenv
 
 
 @pytest.fixture
@@ -120,6 +122,16 @@ def test_env_all(env_with_vars):
     assert env_vars["NESTED_VAR"] == "nested_value"
 
 
+def test_env_view(env_with_vars):
+    view = env_with_vars.view()
+    assert view["TEST_VAR"] == "test_value"
+    with pytest.raises(TypeError):
+        view["TEST_VAR"] = "changed"
+    env_vars = env_with_vars.all()
+    env_vars["TEST_VAR"] = "changed"
+    assert env_with_vars.get("TEST_VAR") == "test_value"
+
+
 def test_env_factory():
     env = EnvFactory.create()
     assert isinstance(env, Env)
@@ -134,3 +146,133 @@ def test_env_empty_string_vars(env_with_vars):
     result = env_with_vars.replace_vars(test_data)
     assert result["empty"] is None
     assert result["with_default"] == "default"
+
+
+def test_env_replace_vars_keeps_unchanged_subtrees(env_with_vars):
+    literal = {"host": "localhost", "ports": [80, 443]}
+    data = {"literal": literal, "value": {"name": "${TEST_VAR}"}}
+    result = env_with_vars.replace_vars(data)
+    assert result == {"literal": literal, "value": {"name": "test_value"}}
+    assert result["literal"] is literal
+    assert data["value"] == {"name": "${TEST_VAR}"}
+    assert env_with_vars.replace_vars(literal) is literal
+
+
+def test_env_replace_vars_keeps_aliases_shared(env_with_vars):
+    shared = {"user": "${TEST_VAR}"}
+    result = env_with_vars.replace_vars({"a": shared, "b": [shared]})
+    assert result["a"] == {"user": "test_value"}
+    assert result["a"] is result["b"][0]
+
+
+def test_env_isolated_does_not_modify_environ(tmp_path, monkeypatch):
+    monkeypatch.delenv("ISOLATED_VAR", raising=False)
+    monkeypatch.setenv("PROCESS_VAR", "process")
+    env_file = tmp_path / ".env"
+    env_file.write_text("ISOLATED_VAR=isolated\nPROCESS_VAR=file\n")
+
+    env = Env(env_file, isolated=True)
+    assert env.get("ISOLATED_VAR") == "isolated"
+    assert env.get("PROCESS_VAR") == "process"
+    assert "ISOLATED_VAR" not in os.environ
+    assert Env(env_file, isolated=True, override=True).get("PROCESS_VAR") == "file"
+
+
+def test_env_isolated_file_precedence(tmp_path):
+    first = tmp_path / "first.env"
+    second = tmp_path / "second.env"
+    first.write_text("SHARED_VAR=first\nFIRST_VAR=1\n")
+    second.write_text("SHARED_VAR=second\n")
+    env = EnvFactory.create([first, second, tmp_path / "missing.env"], isolated=True)
+    assert env.get("SHARED_VAR") == "second"
+    assert env.get("FIRST_VAR") == "1"
+
+
+def test_read_dotenv_cached_by_mtime(tmp_path, monkeypatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text("CACHED_VAR=one\n")
+    calls = []
+    original = env_module.dotenv_values
+
+    def dotenv_values(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(env_module, "dotenv_values", dotenv_values)
+    assert read_dotenv(env_file) == {"CACHED_VAR": "one"}
+    assert read_dotenv(str(env_file)) == {"CACHED_VAR": "one"}
+    assert len(calls) == 1
+
+    env_file.write_text("CACHED_VAR=two\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert read_dotenv(env_file) == {"CACHED_VAR": "two"}
+    assert len(calls) == 2
+
+
+def test_env_snapshot_refresh(env_with_vars, monkeypatch):
+    monkeypatch.setenv("TEST_VAR", "changed")
+    assert env_with_vars.get("TEST_VAR") == "test_value"
+    assert env_with_vars.version == 0
+
+    assert env_with_vars.refresh() is True
+    assert env_with_vars.get("TEST_VAR") == "changed"
+    assert env_with_vars.version == 1
+    assert env_with_vars.refresh() is False
+    assert env_with_vars.version == 1
+
+
+def test_env_isolated_refresh_rereads_files(tmp_path, monkeypatch):
+    monkeypatch.delenv("FILE_VAR", raising=False)
+    env_file = tmp_path / ".env"
+    env_file.write_text("FILE_VAR=one\n")
+    env = Env(env_file, isolated=True)
+
+    env_file.write_text("FILE_VAR=two\n")
+    stat = env_file.stat()
+    os.utime(env_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert env.refresh() is True
+    assert env.get("FILE_VAR") == "two"
+
+
+def test_env_update(env_with_vars):
+    snapshot = env_with_vars.all()
+    assert env_with_vars.update({"TEST_VAR": "rotated", "TEST_NUMBER": "123"}) == {"TEST_VAR"}
+    assert env_with_vars.get("TEST_VAR") == "rotated"
+    assert env_with_vars.version == 1
+    assert snapshot["TEST_VAR"] == "test_value"
+    assert os.environ["TEST_VAR"] == "test_value"
+
+    assert env_with_vars.update({"TEST_VAR": None}) == {"TEST_VAR"}
+    assert env_with_vars.get("TEST_VAR") is None
+    assert env_with_vars.update({"TEST_VAR": None}) == set()
+    assert env_with_vars.version == 2
+
+
+def test_env_secrets_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("OVERRIDDEN", "from-env")
+    monkeypatch.delenv("DB_PASSWORD", raising=False)
+    (tmp_path / "DB_PASSWORD").write_text("secret\n")
+    (tmp_path / "OVERRIDDEN").write_text("from-file")
+    env = EnvFactory.create(secrets_dir=tmp_path, isolated=True)
+
+    assert env.get("DB_PASSWORD") == "secret"
+    assert env.get("OVERRIDDEN") == "from-env"
+    assert env.replace_var("${DB_PASSWORD}") == "secret"
+    assert env.all()["DB_PASSWORD"] == "secret"
+    assert env.get("MISSING", "default") == "default"
+
+
+def test_env_file_indirection(tmp_path, monkeypatch):
+    secret_file = tmp_path / "password"
+    secret_file.write_text("secret\n")
+    monkeypatch.delenv("DB_PASSWORD", raising=False)
+    monkeypatch.setenv("DB_PASSWORD_FILE", str(secret_file))
+    assert Env(isolated=True).get("DB_PASSWORD") is None
+    env = Env(isolated=True, secrets_dir=tmp_path / "mounted")
+    assert env.get("DB_PASSWORD") == "secret"
+
+    secret_file.write_text("rotated\n")
+    assert env.get("DB_PASSWORD") == "secret"
+    env.refresh()
+    assert env.get("DB_PASSWORD") == "rotated"
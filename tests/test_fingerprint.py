@@ -0,0 +1,64 @@
+from array import array
+
+from config_loader.fingerprint import Fingerprinter
+from config_loader.frozen import freeze
+from config_loader.records import RecordTable
+
+
+def test_fingerprint_is_content_based():
+    fingerprinter = Fingerprinter()
+    first = {"a": 1, "b": [1, 2, {"c": None}]}
+    second = {"b": [1, 2, {"c": None}], "a": 1}
+    assert fingerprinter.fingerprint(first) == fingerprinter.fingerprint(second)
+    assert fingerprinter.fingerprint(first) == Fingerprinter().fingerprint(freeze(first))
+
+
+def test_fingerprint_distinguishes_types():
+    fingerprinter = Fingerprinter()
+    values = [1, 1.0, True, "1", None, [1], {"1": 1}, {1}]
+    assert len({fingerprinter.fingerprint(value) for value in values}) == len(values)
+
+
+def test_fingerprint_detects_changes():
+    fingerprinter = Fingerprinter()
+    assert fingerprinter.fingerprint({"a": [1, 2]}) != fingerprinter.fingerprint({"a": [2, 1]})
+    assert fingerprinter.fingerprint({"a": 1}) != fingerprinter.fingerprint({"b": 1})
+
+
+def test_fingerprint_compact_sequences_match_lists():
+    records = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    fingerprinter = Fingerprinter()
+    assert fingerprinter.fingerprint(array("q", [1, 2])) == fingerprinter.fingerprint([1, 2])
+    assert fingerprinter.fingerprint(RecordTable.from_records(records)) == (
+        fingerprinter.fingerprint(records)
+    )
+
+
+def test_fingerprint_reuses_previous_digests(monkeypatch):
+    shared = freeze({"hosts": ["a", "b"]})
+    previous = Fingerprinter()
+    previous.fingerprint(freeze({"database": shared, "debug": False}))
+
+    fingerprinter = Fingerprinter(previous)
+    hashed = []
+    original = Fingerprinter._container_digest
+
+    def container_digest(self, node):
+        hashed.append(node)
+        return original(self, node)
+
+    monkeypatch.setattr(Fingerprinter, "_container_digest", container_digest)
+    fingerprinter.fingerprint(freeze({"database": shared, "debug": True}))
+    assert all(node is not shared and node is not shared["hosts"] for node in hashed)
+    assert len(hashed) == 1
+
+
+def test_fingerprint_sees_in_place_changes_of_mutable_trees():
+    fingerprinter = Fingerprinter()
+    tree = {"database": {"hosts": ["a"]}, "debug": (1, [2])}
+    before = fingerprinter.fingerprint(tree)
+    tree["database"]["hosts"].append("b")
+    after = fingerprinter.fingerprint(tree)
+    assert after != before
+    tree["debug"][1].append(3)
+    assert fingerprinter.fingerprint(tree) != after
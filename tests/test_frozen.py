@@ -0,0 +1,93 @@
+import copy
+import pickle
+from array import array
+
+import pytest
+
+from config_loader.frozen import FrozenArray, FrozenDict, freeze
+
+
+@pytest.fixture
+def frozen_tree():
+    return freeze(
+        {
+            "database": {"host": "localhost", "port": 5432},
+            "features": ["feature1", "feature2"],
+            "tags": {"a", "b"},
+        }
+    )
+
+
+def test_freeze_converts_containers(frozen_tree):
+    assert isinstance(frozen_tree, FrozenDict)
+    assert isinstance(frozen_tree["database"], FrozenDict)
+    assert frozen_tree["features"] == ("feature1", "feature2")
+    assert frozen_tree["tags"] == frozenset({"a", "b"})
+
+
+def test_frozen_dict_rejects_mutation(frozen_tree):
+    with pytest.raises(TypeError):
+        frozen_tree["database"] = {}
+    with pytest.raises(AttributeError):
+        frozen_tree.update({"key": "value"})
+    with pytest.raises(TypeError):
+        frozen_tree["database"]["host"] = "remote"
+
+
+def test_frozen_dict_is_hashable(frozen_tree):
+    same_tree = freeze(
+        {
+            "database": {"port": 5432, "host": "localhost"},
+            "features": ["feature1", "feature2"],
+            "tags": {"b", "a"},
+        }
+    )
+    assert frozen_tree == same_tree
+    assert hash(frozen_tree) == hash(same_tree)
+    assert {frozen_tree: "cached"}[same_tree] == "cached"
+
+
+def test_frozen_dict_with_unhashable_value():
+    with pytest.raises(TypeError):
+        hash(FrozenDict({"key": []}))
+
+
+def test_frozen_dict_equals_plain_dict():
+    assert FrozenDict({"key": "value"}) == {"key": "value"}
+    assert FrozenDict({"key": "value"}) != {"key": "other"}
+
+
+def test_frozen_dict_copy_is_zero_copy(frozen_tree):
+    assert copy.copy(frozen_tree) is frozen_tree
+    assert copy.deepcopy(frozen_tree) is frozen_tree
+
+
+def test_frozen_dict_pickle(frozen_tree):
+    assert pickle.loads(pickle.dumps(frozen_tree)) == frozen_tree
+
+
+def test_freeze_is_idempotent(frozen_tree):
+    assert freeze(frozen_tree) is frozen_tree
+
+
+def test_freeze_numeric_array():
+    values = array("q", [1, 2, 3])
+    frozen = freeze({"values": values})["values"]
+    assert isinstance(frozen, FrozenArray)
+    assert frozen == values
+    assert frozen[1] == 2
+    assert frozen[1:] == FrozenArray(array("q", [2, 3]))
+    assert list(frozen) == [1, 2, 3]
+    assert frozen.typecode == "q"
+
+    values[0] = 10
+    assert frozen[0] == 1
+
+
+def test_frozen_array_is_hashable_and_read_only():
+    frozen = FrozenArray(array("d", [0.5, 1.5]))
+    assert hash(frozen) == hash(FrozenArray(array("d", [0.5, 1.5])))
+    assert pickle.loads(pickle.dumps(frozen)) == frozen
+    assert copy.deepcopy(frozen) is frozen
+    with pytest.raises(TypeError):
+        frozen[0] = 1.0
@@ -0,0 +1,84 @@
+import pytest
+
+from config_loader.layers import LayerStack, merge_mappings
+
+
+@pytest.fixture
+def defaults():
+    return {
+        "database": {"host": "localhost", "port": 5432, "options": {"ssl": False}},
+        "servers": [{"name": "api"}],
+        "debug": False,
+    }
+
+
+@pytest.fixture
+def stack(defaults):
+    return LayerStack(
+        [
+            defaults,
+            {"database": {"host": "prod-db", "options": {"timeout": 5}}},
+            {"debug": True},
+        ]
+    )
+
+
+def test_layer_stack_resolves_top_down(stack):
+    assert stack.get("database.host") == "prod-db"
+    assert stack.get("database.port") == 5432
+    assert stack.get("database.options.ssl") is False
+    assert stack.get("database.options.timeout") == 5
+    assert stack.get("debug") is True
+    assert stack.get("servers.0.name") == "api"
+    assert stack.get("missing", "default") == "default"
+
+
+def test_layer_stack_materializes_merged_subtree(stack, defaults):
+    assert stack.get("database") == {
+        "host": "prod-db",
+        "port": 5432,
+        "options": {"ssl": False, "timeout": 5},
+    }
+    assert stack.get("servers") is defaults["servers"]
+    assert stack.all()["debug"] is True
+
+
+def test_layer_stack_scalar_hides_lower_layers(defaults):
+    stack = LayerStack([defaults, {"database": "sqlite://"}])
+    assert stack.get("database") == "sqlite://"
+    assert stack.get("database.host") is None
+
+    stack = LayerStack([defaults, {"database": "sqlite://"}, {"database": {"name": "db"}}])
+    assert stack.get("database") == {"name": "db"}
+    assert stack.get("database.host") is None
+
+
+def test_layer_stack_list_replaces_lower_layers(defaults):
+    stack = LayerStack([defaults, {"servers": [{"port": 1}]}])
+    assert stack.get("servers.0.port") == 1
+    assert stack.get("servers.0.name") is None
+
+
+def test_layer_stack_set_layer_invalidates_defined_paths(stack):
+    assert stack.get("database.host") == "prod-db"
+    assert stack.get("debug") is True
+    memo = stack._memo
+    stack.set_layer(2, {"debug": False, "database": {"host": "override"}})
+    assert "debug" not in memo
+    assert "database.host" not in memo
+    assert stack.get("debug") is False
+    assert stack.get("database.host") == "override"
+
+
+def test_layer_stack_set_layer_keeps_unrelated_paths(stack):
+    assert stack.get("database.port") == 5432
+    stack.set_layer(2, {"debug": False})
+    assert "database.port" in stack._memo
+
+
+def test_merge_mappings_reuses_unmerged_subtrees(defaults):
+    override = {"extra": {"key": "value"}}
+    merged = merge_mappings([defaults, override])
+    assert merged["database"] is defaults["database"]
+    assert merged["extra"] is override["extra"]
+    assert merge_mappings([defaults]) is defaults
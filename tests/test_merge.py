@@ -0,0 +1,80 @@
+import pytest
+
+from config_loader.exceptions import ConfigError
+from config_loader.merge import DeepMerger, ListStrategy, deep_merge
+
+
+@pytest.fixture
+def base():
+    return {
+        "database": {"host": "localhost", "port": 5432},
+        "servers": [{"name": "api", "port": 80}, {"name": "web", "port": 8080}],
+        "logging": {"level": "INFO", "handlers": ["console"]},
+    }
+
+
+def test_deep_merge_mappings(base):
+    result = deep_merge(base, {"database": {"host": "prod-db"}})
+    assert result["database"] == {"host": "prod-db", "port": 5432}
+
+
+def test_deep_merge_replaces_lists_by_default(base):
+    result = deep_merge(base, {"logging": {"handlers": ["file"]}})
+    assert result["logging"]["handlers"] == ["file"]
+
+
+def test_deep_merge_append_lists(base):
+    result = deep_merge(base, {"logging": {"handlers": ["file"]}}, ListStrategy.APPEND)
+    assert result["logging"]["handlers"] == ["console", "file"]
+
+
+def test_deep_merge_lists_by_key(base):
+    override = {"servers": [{"name": "web", "port": 9090}, {"name": "admin", "port": 81}]}
+    result = deep_merge(base, override, ListStrategy.MERGE_BY_KEY, "name")
+    assert result["servers"] == [
+        {"name": "api", "port": 80},
+        {"name": "web", "port": 9090},
+        {"name": "admin", "port": 81},
+    ]
+
+
+def test_deep_merge_by_key_requires_key():
+    with pytest.raises(ConfigError):
+        DeepMerger(ListStrategy.MERGE_BY_KEY)
+
+
+def test_deep_merge_does_not_modify_inputs(base):
+    override = {"database": {"port": 6432}, "logging": {"handlers": ["file"]}}
+    deep_merge(base, override, ListStrategy.APPEND)
+    assert base["database"]["port"] == 5432
+    assert base["logging"]["handlers"] == ["console"]
+    assert override == {"database": {"port": 6432}, "logging": {"handlers": ["file"]}}
+
+
+def test_deep_merge_reuses_untouched_subtrees(base):
+    override = {"feature": {"enabled": True}}
+    result = deep_merge(base, override)
+    assert result["database"] is base["database"]
+    assert result["feature"] is override["feature"]
+
+
+def test_deep_merge_scalar_replaces_mapping(base):
+    assert deep_merge(base, {"database": None})["database"] is None
+
+
+def test_merge_all_folds_in_order():
+    trees = [{"a": {"x": 1}}, {"a": {"y": 2}}, {"a": {"x": 3}}]
+    assert DeepMerger().merge_all(trees) == {"a": {"x": 3, "y": 2}}
+    assert trees[0] == {"a": {"x": 1}}
+
+
+def test_merge_all_empty():
+    assert DeepMerger().merge_all([]) == {}
+
+
+def test_merger_does_not_modify_previous_results():
+    merger = DeepMerger(ListStrategy.APPEND)
+    first = merger.merge({"a": {"x": 1}, "items": [1]}, {"a": {"y": 2}, "items": [2]})
+    second = merger.merge(first, {"a": {"z": 3}, "items": [3]})
+    assert first == {"a": {"x": 1, "y": 2}, "items": [1, 2]}
+    assert second == {"a": {"x": 1, "y": 2, "z": 3}, "items": [1, 2, 3]}
@@ -0,0 +1,58 @@
+import pytest
+
+from config_loader.objects import ConfigObject, shape_class, to_object
+
+
+@pytest.fixture
+def servers():
+    return {
+        "servers": [
+            {"host": "a", "port": 1},
+            {"host": "b", "port": 2},
+        ],
+        "database": {"host": "localhost", "port": 5432},
+    }
+
+
+def test_to_object_attribute_access(servers):
+    obj = to_object(servers)
+    assert obj.database.host == "localhost"
+    assert obj.database.port == 5432
+    assert obj.servers[1].host == "b"
+    assert isinstance(obj.servers, tuple)
+
+
+def test_to_object_reuses_class_per_shape(servers):
+    obj = to_object(servers)
+    assert type(obj.servers[0]) is type(obj.servers[1])
+    assert type(obj.servers[0]) is type(obj.database)
+    assert shape_class(("host", "port")) is type(obj.database)
+
+
+def test_to_object_has_no_instance_dict(servers):
+    obj = to_object(servers)
+    assert not hasattr(obj.database, "__dict__")
+    assert isinstance(obj.database, ConfigObject)
+
+
+def test_to_object_is_read_only(servers):
+    obj = to_object(servers)
+    with pytest.raises(AttributeError):
+        obj.database.host = "remote"
+    with pytest.raises(AttributeError):
+        obj.database.missing
+
+
+def test_to_object_keeps_non_identifier_keys_as_dict():
+    obj = to_object({"limits": {"5": "five", "class": "x"}, "name": "app"})
+    assert obj.limits == {"5": "five", "class": "x"}
+    assert obj.name == "app"
+
+
+def test_config_object_equality_and_asdict(servers):
+    first = to_object(servers)
+    second = to_object(servers)
+    assert first == second
+    assert hash(first.database) == hash(second.database)
+    assert first.database._asdict() == {"host": "localhost", "port": 5432}
+    assert repr(first.database) == "ConfigObject(host='localhost', port=5432)"
@@ -0,0 +1,84 @@
+import pytest
+
+from config_loader.exceptions import ConfigError
+from config_loader.overrides import EnvOverrides
+
+
+def test_env_overrides_tree():
+    environ = {
+        "APP__DB__HOST": "prod-db",
+        "APP__DB__PORT": "6432",
+        "APP__DEBUG": "true",
+        "APP__NAME": "0x1f-service",
+        "APP__RATIO": "0.5",
+        "APP__EMPTY": "",
+        "APP__BROKEN__": "ignored",
+        "APPLICATION__DB__HOST": "other",
+        "PATH": "/usr/bin",
+    }
+    assert EnvOverrides("APP").tree(environ) == {
+        "db": {"host": "prod-db", "port": 6432},
+        "debug": True,
+        "name": "0x1f-service",
+        "ratio": 0.5,
+        "empty": "",
+    }
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("False", False),
+        ("NULL", None),
+        ("-12", -12),
+        ("1e3", 1000.0),
+        ("-.5", -0.5),
+        ("NO", "NO"),
+        ("01234", "01234"),
+        ("12:30", "12:30"),
+        ("1_0", "1_0"),
+        (" 5", " 5"),
+        ("~", "~"),
+        ("nan", "nan"),
+    ],
+)
+def test_env_overrides_strict_coercion(value, expected):
+    coerced = EnvOverrides("APP").tree({"APP__VALUE": value})["value"]
+    assert coerced == expected and type(coerced) is type(expected)
+
+
+def test_env_overrides_without_coercion():
+    tree = EnvOverrides("APP", "_", coerce=False).tree({"APP_DB_PORT": "6432"})
+    assert tree == {"db": {"port": "6432"}}
+
+
+def test_env_overrides_conflict():
+    with pytest.raises(ConfigError):
+        EnvOverrides("APP").tree({"APP__DB": "x", "APP__DB__HOST": "y"})
+
+
+def test_env_overrides_empty_separator():
+    with pytest.raises(ConfigError):
+        EnvOverrides("APP", "")
+
+
+def test_env_overrides_apply_matches_existing_keys():
+    configs = {"maxConnections": 10, "servers": [{"host": "a"}, {"host": "b"}], "db": None}
+    environ = {
+        "APP__MAXCONNECTIONS": "20",
+        "APP__SERVERS__1__HOST": "c",
+        "APP__DB__HOST": "prod-db",
+    }
+    result = EnvOverrides("APP").apply(configs, environ)
+    assert result == {
+        "maxConnections": 20,
+        "servers": [{"host": "a"}, {"host": "c"}],
+        "db": {"host": "prod-db"},
+    }
+    assert configs["maxConnections"] == 10
+
+
+@pytest.mark.parametrize("name", ["APP__SERVERS__2__HOST", "APP__SERVERS__FIRST__HOST"])
+def test_env_overrides_apply_invalid_index(name):
+    with pytest.raises(ConfigError):
+        EnvOverrides("APP").apply({"servers": [{"host": "a"}]}, {name: "c"})
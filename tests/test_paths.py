@@ -0,0 +1,32 @@
+from config_loader.paths import Selector, parse_path
+
+
+def test_parse_path_plain_keys():
+    assert parse_path("database.host") == ("database", "host")
+    assert parse_path("array.0.name") == ("array", "0", "name")
+
+
+def test_parse_path_selector():
+    assert parse_path("upstreams[name=payments].timeout") == (
+        "upstreams",
+        Selector("upstreams", "name", "payments"),
+        "timeout",
+    )
+
+
+def test_parse_path_selector_value_with_dots():
+    assert parse_path("a.hosts[host=api.example.com].port") == (
+        "a",
+        "hosts",
+        Selector("a.hosts", "host", "api.example.com"),
+        "port",
+    )
+
+
+def test_parse_path_leading_selector():
+    assert parse_path("upstreams.[id=1]") == ("upstreams", Selector("upstreams", "id", "1"))
+
+
+def test_parse_path_invalid_selector_falls_back_to_keys():
+    assert parse_path("array[invalid") == ("array[invalid",)
+    assert parse_path("array[a=b]]") == ("array[a=b]]",)
@@ -0,0 +1,101 @@
+from array import array
+
+import pytest
+
+from config_loader.exceptions import ConfigError
+from config_loader.frozen import FrozenDict, freeze
+from config_loader.persistent import PathCopier
+from config_loader.records import RecordTable
+
+
+@pytest.fixture
+def tree():
+    return {
+        "database": {"host": "localhost", "port": 5432},
+        "cache": {"ttl": 60},
+        "servers": [{"name": "api", "port": 80}, {"name": "web", "port": 81}],
+    }
+
+
+def test_set_copies_only_path(tree):
+    result = PathCopier().set(tree, "database.host", "remote")
+    assert result["database"]["host"] == "remote"
+    assert tree["database"]["host"] == "localhost"
+    assert result is not tree
+    assert result["database"] is not tree["database"]
+    assert result["cache"] is tree["cache"]
+    assert result["servers"] is tree["servers"]
+
+
+def test_set_list_item_and_selector(tree):
+    result = PathCopier().set(tree, "servers.1.port", 8081)
+    assert result["servers"][1]["port"] == 8081
+    assert result["servers"][0] is tree["servers"][0]
+
+    result = PathCopier().set(tree, "servers[name=api].port", 8080)
+    assert result["servers"][0]["port"] == 8080
+    assert tree["servers"][0]["port"] == 80
+
+
+def test_set_creates_missing_mappings(tree):
+    result = PathCopier().set(tree, "new.nested.key", "value")
+    assert result["new"] == {"nested": {"key": "value"}}
+
+
+def test_set_same_value_keeps_tree(tree):
+    assert PathCopier().set(tree, "cache", tree["cache"]) is tree
+
+
+def test_set_batch_reuses_copied_containers(tree):
+    copier = PathCopier()
+    first = copier.set(tree, "database.host", "remote")
+    second = copier.set(first, "database.port", 1)
+    assert second is first
+    assert second["database"] == {"host": "remote", "port": 1}
+    assert tree["database"] == {"host": "localhost", "port": 5432}
+
+
+def test_set_frozen_tree(tree):
+    frozen = freeze(tree)
+    result = PathCopier().set(frozen, "database.options", {"ssl": True})
+    assert isinstance(result["database"], FrozenDict)
+    assert result["database"]["options"] == FrozenDict({"ssl": True})
+    assert result["servers"] is frozen["servers"]
+    assert "options" not in frozen["database"]
+
+    result = PathCopier().set(frozen, "servers.0.port", 1)
+    assert result["servers"][0]["port"] == 1
+    assert isinstance(result["servers"], tuple)
+
+
+def test_set_compact_containers():
+    tree = {
+        "routes": RecordTable(("path", "port"), [("/a", 1), ("/b", 2)]),
+        "weights": array("d", [0.5, 1.5]),
+    }
+    result = PathCopier().set(tree, "routes.1.port", 3)
+    result = PathCopier().set(result, "weights.0", 2.5)
+    assert isinstance(result["routes"], RecordTable)
+    assert result["routes"].rows == (("/a", 1), ("/b", 3))
+    assert result["weights"] == array("d", [2.5, 1.5])
+    assert tree["routes"].rows == (("/a", 1), ("/b", 2))
+
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "routes.0.extra", 1)
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "routes.1", 5)
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "routes.1", {"path": "/c"})
+    result = PathCopier().set(tree, "routes.1", {"port": 4, "path": "/c"})
+    assert result["routes"].rows == (("/a", 1), ("/c", 4))
+
+
+def test_set_invalid_paths(tree):
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "database.host.name", "value")
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "servers.5.port", 1)
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "servers.first.port", 1)
+    with pytest.raises(ConfigError):
+        PathCopier().set(tree, "servers[name=missing].port", 1)
@@ -0,0 +1,47 @@
+import pickle
+
+import pytest
+
+from config_loader.records import Record, RecordTable
+
+
+@pytest.fixture
+def routes():
+    return [{"path": f"/route{i}", "port": 8000 + i} for i in range(5)]
+
+
+@pytest.fixture
+def table(routes):
+    return RecordTable.from_records(routes)
+
+
+def test_record_table_shares_keys(table, routes):
+    assert table.keys == ("path", "port")
+    assert table.rows[1] == ("/route1", 8001)
+    assert len(table) == 5
+    assert table == routes
+
+
+def test_record_table_records(table):
+    record = table[3]
+    assert isinstance(record, Record)
+    assert record["path"] == "/route3"
+    assert record.get("missing", "default") == "default"
+    assert "port" in record
+    assert dict(record) == {"path": "/route3", "port": 8003}
+    assert record == {"path": "/route3", "port": 8003}
+    with pytest.raises(KeyError):
+        record["missing"]
+
+
+def test_record_table_iteration_and_columns(table):
+    assert [record["port"] for record in table] == [8000, 8001, 8002, 8003, 8004]
+    assert table.column("path") == ["/route0", "/route1", "/route2", "/route3", "/route4"]
+    assert table[1:3] == [{"path": "/route1", "port": 8001}, {"path": "/route2", "port": 8002}]
+
+
+def test_record_table_map_values_and_pickle(table):
+    mapped = table.map_values(str)
+    assert mapped[0]["port"] == "8000"
+    assert pickle.loads(pickle.dumps(table)) == table
+    assert hash(table) == hash(RecordTable(table.keys, table.rows))
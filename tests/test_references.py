@@ -0,0 +1,87 @@
+import pytest
+
+from config_loader.env import Env
+from config_loader.exceptions import CircularReferenceError, ConfigError
+from config_loader.references import ReferenceResolver, resolve_references
+
+
+@pytest.fixture
+def configs():
+    return {
+        "db": {"host": "db.local", "port": 5432},
+        "url": "postgres://${config:db.host}:${config:db.port}/app",
+        "port": "${config:db.port}",
+        "replica": {"url": "${config:url}", "settings": "${config:db}"},
+        "static": {"name": "app"},
+    }
+
+
+def test_resolve_references(configs):
+    resolved = resolve_references(configs)
+    assert resolved["url"] == "postgres://db.local:5432/app"
+    assert resolved["port"] == 5432
+    assert resolved["replica"]["url"] == "postgres://db.local:5432/app"
+    assert resolved["replica"]["settings"] == {"host": "db.local", "port": 5432}
+    assert resolved["static"] is configs["static"]
+    assert configs["url"].startswith("postgres://${config:")
+
+
+def test_resolve_references_through_lists():
+    resolved = resolve_references({"hosts": ["a", "${config:primary}"], "primary": "b"})
+    assert resolved["hosts"] == ["a", "b"]
+    assert resolve_references({"first": "${config:hosts.0}", "hosts": ["a"]})["first"] == "a"
+
+
+def test_resolve_references_keeps_key_types():
+    configs = {1: {"ref": "${config:name}", 2: "${config:1.ref}"}, "name": "app", 3: [0]}
+    resolved = resolve_references(configs)
+    assert resolved == {1: {"ref": "app", 2: "app"}, "name": "app", 3: [0]}
+    assert resolve_references({"first": "${config:3.0}", 3: [7]})["first"] == 7
+
+
+def test_resolve_references_through_referenced_mapping():
+    configs = {"x": "${config:y.z}", "y": "${config:w}", "w": {"z": 1}, "v": "${config:x}"}
+    assert resolve_references(configs) == {"x": 1, "y": {"z": 1}, "w": {"z": 1}, "v": 1}
+
+    resolver = ReferenceResolver()
+    resolver.resolve(configs)
+    assert resolver.resolve({**configs, "w": {"z": 2}})["v"] == 2
+
+
+def test_resolve_references_cycle():
+    with pytest.raises(CircularReferenceError, match="a -> b -> a"):
+        resolve_references({"a": "${config:b}", "b": "${config:a}"})
+    with pytest.raises(CircularReferenceError):
+        resolve_references({"a": {"b": "${config:a}"}})
+
+
+def test_resolve_references_missing_path():
+    with pytest.raises(ConfigError, match="missing"):
+        resolve_references({"a": "${config:missing}"})
+
+
+def test_reference_resolver_reevaluates_dependents_only(configs):
+    resolver = ReferenceResolver()
+    resolver.resolve(configs)
+    rendered = []
+    original = resolver._render
+
+    def render(path, tree):
+        rendered.append(path)
+        return original(path, tree)
+
+    resolver._render = render
+    updated = {**configs, "db": {"host": "db.prod", "port": 5432}, "static": {"name": "x"}}
+    resolved = resolver.resolve(updated)
+    assert sorted(rendered) == [("replica", "settings"), ("replica", "url"), ("url",)]
+    assert resolved["replica"]["url"] == "postgres://db.prod:5432/app"
+    assert resolved["port"] == 5432
+
+    rendered.clear()
+    assert resolver.resolve(updated) == resolved
+    assert rendered == []
+
+
+def test_env_pattern_ignores_config_references(monkeypatch):
+    monkeypatch.setenv("config", "env")
+    assert Env().replace_var("${config:db.host}") == "${config:db.host}"
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from config_loader.secret_files import SecretsDirectory, read_secret
+
+
+def _mount(root, version, secrets):
+    """Lays out a directory like a Kubernetes secret volume."""
+    data_dir = root / f"..{version}"
+    data_dir.mkdir()
+    for name, value in secrets.items():
+        (data_dir / name).write_text(value)
+    tmp_link = root / "..data_tmp"
+    os.symlink(data_dir.name, tmp_link)
+    os.replace(tmp_link, root / "..data")
+    for name in secrets:
+        if not (root / name).is_symlink():
+            os.symlink(os.path.join("..data", name), root / name)
+
+
+@pytest.fixture
+def secrets_dir(tmp_path):
+    _mount(tmp_path, "v1", {"DB_PASSWORD": "secret\n", "API_KEY": "key"})
+    return tmp_path
+
+
+def test_read_secret(tmp_path):
+    (tmp_path / "value").write_text("secret\r\n")
+    assert read_secret(tmp_path / "value") == "secret"
+    assert read_secret(tmp_path / "missing") is None
+
+
+def test_secrets_directory_lazy_reads(secrets_dir):
+    secrets = SecretsDirectory(secrets_dir)
+    assert secrets.get("DB_PASSWORD") == "secret"
+    assert secrets.get("..data") is None
+    assert secrets.get("../DB_PASSWORD") is None
+    assert secrets.get(f"..data{os.sep}DB_PASSWORD") is None
+    assert secrets.get(str(secrets_dir / "API_KEY")) is None
+    assert secrets.get("") is None
+    assert secrets.get("MISSING") is None
+    assert secrets.names() == ["API_KEY", "DB_PASSWORD"]
+    assert secrets.all() == {"API_KEY": "key", "DB_PASSWORD": "secret"}
+
+
+def test_secrets_directory_detects_symlink_swap(secrets_dir):
+    secrets = SecretsDirectory(secrets_dir)
+    assert secrets.get("DB_PASSWORD") == "secret"
+    assert secrets.check() is False
+
+    _mount(secrets_dir, "v2", {"DB_PASSWORD": "rotated", "API_KEY": "key"})
+    assert secrets.get("DB_PASSWORD") == "secret"
+    assert secrets.check() is True
+    assert secrets.get("DB_PASSWORD") == "rotated"
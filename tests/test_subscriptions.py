@@ -0,0 +1,56 @@
+import logging
+
+from config_loader.diff import ChangeKind, ConfigChange
+from config_loader.subscriptions import SubscriptionTrie
+
+
+def _change(path):
+    return ConfigChange(path, ChangeKind.CHANGED, 1, 2)
+
+
+def test_subscription_trie_match():
+    trie = SubscriptionTrie()
+    database = trie.add("database", print)
+    wildcard = trie.add("database.*", print)
+    host = trie.add("database.host", print)
+    other = trie.add("logging.*", print)
+
+    assert set(trie.match("database.host")) == {database, wildcard, host}
+    assert set(trie.match("database.port")) == {database, wildcard}
+    assert set(trie.match("database.options.ssl")) == {database, wildcard}
+    assert set(trie.match("")) == {database, wildcard, host, other}
+    assert not set(trie.match("cache.size"))
+
+
+def test_subscription_trie_notify_groups_changes_in_order():
+    trie = SubscriptionTrie()
+    calls = []
+    trie.add("b", lambda changes: calls.append(("b", [c.path for c in changes])))
+    trie.add("a.*", lambda changes: calls.append(("a", [c.path for c in changes])))
+    trie.notify([_change("a.x"), _change("b"), _change("a.y"), _change("c")])
+    assert calls == [("b", ["b"]), ("a", ["a.x", "a.y"])]
+
+
+def test_subscription_trie_isolates_errors(caplog):
+    trie = SubscriptionTrie()
+    calls = []
+
+    def failing(changes):
+        raise RuntimeError("boom")
+
+    trie.add("a", failing)
+    trie.add("a", calls.append)
+    with caplog.at_level(logging.ERROR):
+        trie.notify([_change("a")])
+    assert len(calls) == 1
+    assert "boom" in caplog.text
+
+
+def test_subscription_cancel():
+    trie = SubscriptionTrie()
+    subscription = trie.add("a.b", print)
+    assert len(trie) == 1
+    subscription.cancel()
+    subscription.cancel()
+    assert len(trie) == 0
+    assert not list(trie.match("a.b"))
@@ -0,0 +1,77 @@
+import pytest
+
+from config_loader.env import Env
+from config_loader.templates import TemplateIndex, Variable, compile_template
+
+
+@pytest.fixture
+def env(monkeypatch):
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    monkeypatch.setenv("DB_PORT", "5432")
+    monkeypatch.delenv("DB_USER", raising=False)
+    return Env()
+
+
+def test_compile_template_segments():
+    template = compile_template("postgres://${DB_USER:admin}@${DB_HOST}/app")
+    assert template.segments == (
+        "postgres://",
+        Variable("DB_USER", "admin"),
+        "@",
+        Variable("DB_HOST", None),
+        "/app",
+    )
+    assert template.variables == {"DB_USER", "DB_HOST"}
+    assert compile_template("literal") is None
+    assert compile_template("${not a var}") is None
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["${DB_HOST}", "${DB_HOST}:${DB_PORT}", "${DB_USER:admin}", "${DB_USER}", "x${DB_USER}y"],
+)
+def test_template_render_matches_replace_var(env, text):
+    assert compile_template(text).render(env) == env.replace_var(text)
+    assert compile_template(text).render(env, "fallback") == env.replace_var(text, "fallback")
+
+
+def test_template_index_render(env, monkeypatch):
+    shared = {"host": "${DB_HOST}"}
+    literal = {"name": "app", "tags": ["a", "b"]}
+    raw = {"primary": shared, "replica": shared, "app": literal, "ports": [80, "${DB_PORT}"]}
+    index = TemplateIndex.scan(raw)
+    assert index.variables == {"DB_HOST", "DB_PORT"}
+
+    rendered = index.render(raw, env)
+    assert rendered == env.replace_vars(raw)
+    assert rendered["app"] is literal
+    assert rendered["primary"] is rendered["replica"]
+    assert raw["primary"] == {"host": "${DB_HOST}"}
+
+    monkeypatch.setenv("DB_PORT", "6432")
+    env.refresh()
+    updated = index.render(rendered, env)
+    assert updated["ports"] == [80, "6432"]
+    assert updated["primary"] is rendered["primary"]
+    assert index.render(updated, env) is updated
+
+
+def test_template_index_render_dependents_only(env):
+    raw = {"db": {"host": "${DB_HOST}", "port": "${DB_PORT}"}, "url": "${DB_HOST}/app"}
+    index = TemplateIndex.scan(raw)
+    assert sorted(index.dependents["DB_HOST"]) == [("db", "host"), ("url",)]
+
+    rendered = index.render(raw, env)
+    changed = env.update({"DB_HOST": "new-db", "DB_PORT": "5432"})
+    assert changed == {"DB_HOST"}
+    updated = index.render(rendered, Env(), variables=["DB_PORT"])
+    assert updated is rendered
+    updated = index.render(rendered, env, variables=changed)
+    assert updated == {"db": {"host": "new-db", "port": "5432"}, "url": "new-db/app"}
+
+
+def test_template_index_render_empty_strings(env):
+    raw = {"empty": "", "items": ["", "x"], "nested": {"value": ""}}
+    rendered = TemplateIndex.scan(raw).render(raw, env)
+    assert rendered == env.replace_vars(raw)
+    assert rendered == {"empty": None, "items": [None, "x"], "nested": {"value": None}}
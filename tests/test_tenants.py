@@ -0,0 +1,89 @@
+import pytest
+
+from config_loader.exceptions import ConfigError
+from config_loader.frozen import FrozenDict, freeze
+from config_loader.tenants import TenantStore
+
+
+@pytest.fixture
+def base():
+    return {
+        "database": {"host": "localhost", "port": 5432},
+        "features": {"billing": False, "search": True},
+        "limits": {"requests": 100},
+    }
+
+
+@pytest.fixture
+def store(base):
+    return TenantStore(
+        base,
+        {
+            "acme": {"features": {"billing": True}},
+            "globex": {"database": {"host": "globex-db"}},
+        },
+        cache_size=1,
+    )
+
+
+def test_tenant_store_view_resolves_delta_then_base(store):
+    view = store.view("acme")
+    assert view.get("features.billing") is True
+    assert view.get("features.search") is True
+    assert view.get("database.host") == "localhost"
+    assert store.view("globex").get("database.host") == "globex-db"
+
+
+def test_tenant_store_materialize_shares_base_subtrees(store, base):
+    configs = store.materialize("acme").all()
+    assert configs["features"] == {"billing": True, "search": True}
+    assert configs["database"] is base["database"]
+    assert configs["limits"] is base["limits"]
+    assert base["features"]["billing"] is False
+
+
+def test_tenant_store_lru(store):
+    acme = store.materialize("acme")
+    assert store.materialize("acme") is acme
+    store.materialize("globex")
+    assert store.cached_tenants() == ["globex"]
+    assert store.materialize("acme") is not acme
+
+
+def test_tenant_store_set_tenant_drops_materialized(store):
+    store.materialize("acme")
+    store.set_tenant("acme", {"limits": {"requests": 500}})
+    assert store.cached_tenants() == []
+    assert store.materialize("acme").get("limits.requests") == 500
+    assert store.materialize("acme").get("features.billing") is False
+
+
+def test_tenant_store_set_base(store):
+    store.materialize("acme")
+    store.set_base({"features": {"billing": False, "search": False}})
+    assert store.cached_tenants() == []
+    assert store.view("acme").get("features.search") is False
+
+
+def test_tenant_store_unknown_tenant(store):
+    with pytest.raises(ConfigError):
+        store.view("initech")
+    with pytest.raises(ConfigError):
+        store.remove_tenant("initech")
+
+
+def test_tenant_store_membership(store):
+    store.remove_tenant("globex")
+    assert "acme" in store
+    assert "globex" not in store
+    assert list(store) == ["acme"]
+    assert len(store) == 1
+
+
+def test_tenant_store_frozen_base(base):
+    store = TenantStore(freeze(base), {"acme": {"features": {"billing": True}}})
+    assert isinstance(store.delta("acme"), FrozenDict)
+    configs = store.materialize("acme").all()
+    assert isinstance(configs, FrozenDict)
+    assert configs["database"] is store.base["database"]
+    assert store.cached_tenants() == []
@@ -1,7 +1,10 @@
+import os
+
 import pytest
 import yaml
 
-from config_loader.utils import yaml_load_config, yaml_load_configs
+from config_loader.env import Env
+from config_loader.utils import yaml_load_config, yaml_load_configs, yaml_load_merged_configs
 
 
 @pytest.fixture
@@ -139,3 +142,33 @@ def test_yaml_load_configs_without_env_file(temp_yaml_dir, monkeypatch):
 def test_yaml_load_configs_nonexistent_directory():
     configs = yaml_load_configs("nonexistent_dir")
     assert configs == {}
+
+
+def test_yaml_load_fused_matches_two_passes(temp_yaml_file, temp_yaml_dir, temp_env_file):
+    assert yaml_load_config(temp_yaml_file, temp_env_file, fused=True) == yaml_load_config(
+        temp_yaml_file, temp_env_file
+    )
+    assert yaml_load_configs(temp_yaml_dir, temp_env_file, fused=True) == yaml_load_configs(
+        temp_yaml_dir, temp_env_file
+    )
+    assert yaml_load_merged_configs(
+        temp_yaml_dir, temp_env_file, fused=True
+    ) == yaml_load_merged_configs(temp_yaml_dir, temp_env_file)
+
+
+def test_yaml_load_config_env_isolation(temp_yaml_file, temp_env_file, monkeypatch):
+    for name in ("DB_HOST", "DB_PORT"):
+        monkeypatch.setenv(name, "unset")
+        monkeypatch.delenv(name)
+
+    config = yaml_load_config(temp_yaml_file, temp_env_file, isolated=True)
+    assert config["database"]["host"] == "localhost"
+    assert "DB_HOST" not in os.environ
+
+    monkeypatch.setenv("DB_PORT", "6432")
+    config = yaml_load_config(temp_yaml_file, Env(temp_env_file, isolated=True))
+    assert config["database"]["port"] == "6432"
+    assert "DB_HOST" not in os.environ
+
+    yaml_load_config(temp_yaml_file, temp_env_file)
+    assert os.environ["DB_HOST"] == "localhost"
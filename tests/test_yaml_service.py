@@ -1,9 +1,17 @@
 import os
+from array import array
 
 import pytest
 import yaml
 
-from config_loader.yaml_service import YamlConfigLoaderError, YamlLoaderService, YamlReaderService
+from config_loader.env import Env
+from config_loader.merge import DeepMerger, ListStrategy
+from config_loader.yaml_service import (
+    EnvSafeLoader,
+    YamlConfigLoaderError,
+    YamlLoaderService,
+    YamlReaderService,
+)
 
 
 @pytest.fixture
@@ -101,6 +109,16 @@ def test_yaml_reader_service_permission_denied(tmp_path):
         os.chmod(config_file, 0o666)
 
 
+def test_yaml_reader_service_load_numeric_arrays(tmp_path):
+    config_file = tmp_path / "tables.yaml"
+    with open(config_file, "w") as f:
+        yaml.dump({"weights": [0.1, 0.2, 0.3], "names": ["a", "b", "c"]}, f)
+
+    config = YamlReaderService.load(config_file, numeric_array_threshold=3)
+    assert config["weights"] == array("d", [0.1, 0.2, 0.3])
+    assert config["names"] == ["a", "b", "c"]
+
+
 def test_yaml_loader_service_load_configs(temp_yaml_dir):
     service = YamlLoaderService(YamlReaderService())
     configs = service.load_configs(temp_yaml_dir)
@@ -186,3 +204,66 @@ def test_yaml_loader_service_directory_access_error(tmp_path):
     finally:
         # Restore permissions for cleanup
         os.chmod(config_dir, 0o755)
+
+
+def test_yaml_loader_service_load_merged(tmp_path):
+    with open(tmp_path / "10-base.yaml", "w") as f:
+        yaml.dump({"db": {"host": "localhost", "port": 5432}, "tags": ["a"]}, f)
+    with open(tmp_path / "20-prod.yaml", "w") as f:
+        yaml.dump({"db": {"host": "prod-db"}, "tags": ["b"]}, f)
+
+    loader = YamlLoaderService(YamlReaderService())
+    assert loader.load_merged(tmp_path) == {"db": {"host": "prod-db", "port": 5432}, "tags": ["b"]}
+    merged = loader.load_merged(tmp_path, DeepMerger(ListStrategy.APPEND))
+    assert merged["tags"] == ["a", "b"]
+
+
+def test_env_safe_loader_substitutes_values(tmp_path, monkeypatch):
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    monkeypatch.setenv("KEY_NAME", "replaced")
+    content = """
+defaults: &defaults
+  host: ${DB_HOST}
+  user: ${DB_USER:admin}
+primary:
+  <<: *defaults
+  port: 5432
+replica: *defaults
+${KEY_NAME}: ${MISSING}
+empty: ""
+tags: ["${DB_HOST}", literal]
+"""
+    file_path = tmp_path / "config.yaml"
+    file_path.write_text(content)
+
+    configs = YamlReaderService.load(file_path, env=Env())
+    assert configs["primary"] == {"host": "prod-db", "user": "admin", "port": 5432}
+    assert configs["replica"] is configs["defaults"]
+    assert configs["${KEY_NAME}"] is None
+    assert configs["empty"] is None
+    assert configs["tags"] == ["prod-db", "literal"]
+    assert configs == Env().replace_vars(YamlReaderService.load(file_path))
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        'k: &k "${DB_HOST:kk}"\nm: {*k : v}\n',
+        'm: {&k "${DB_HOST}": v}\nk: *k\n',
+        'o: !!omap [{a: "${DB_HOST}"}]\np: !!pairs [{a: "${DB_HOST}"}]\n',
+        's: !!set {"${DB_HOST}"}\n',
+        'l: &l ["${DB_HOST}", {a: "${DB_HOST}"}]\nm: *l\n',
+        '"${DB_HOST}"\n',
+    ],
+)
+def test_env_safe_loader_matches_two_passes(monkeypatch, content):
+    monkeypatch.setenv("DB_HOST", "prod-db")
+    two_passes = Env().replace_vars(yaml.safe_load(content))
+    assert yaml.load(content, Loader=EnvSafeLoader.bind(Env())) == two_passes
+
+
+def test_env_safe_loader_bind():
+    env = Env()
+    loader = EnvSafeLoader.bind(env)
+    assert issubclass(loader, EnvSafeLoader)
+    assert loader.env is env